@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
 import os
+import sys
+import stat
+import errno
 import shutil
+import ctypes
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
 
 # ANSI color codes for better logging
 RED = "\033[91m"
@@ -15,7 +25,196 @@ RESET = "\033[0m"
 # Log separator
 LOG_SEPARATOR = f"{YELLOW}{'—' * 50}{RESET}"
 
-def copy_translated_bubbles(language, source_dir=None, target_dir=None, overwrite=False):
+# Buffer size for the read/write fallback copy (1 MiB)
+COPY_BUFSIZE = 1024 * 1024
+
+# Number of buffered per-file log lines written to stdout at once
+LOG_FLUSH_EVERY = 500
+
+# Default number of copy threads; copies are I/O-bound so we go well past the core count
+DEFAULT_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Errors meaning an in-kernel copy method is unsupported for this pair of files
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+# Errors meaning a reflink clone is not possible (unsupported filesystem, or the target already exists)
+_CLONE_FALLBACK_ERRNOS = _COPY_FALLBACK_ERRNOS | {errno.ENOTTY, errno.EEXIST}
+
+# ioctl request number for FICLONE (reflink on btrfs/XFS)
+_FICLONE = 0x40049409
+
+# libc handle for clonefile(2) on macOS, loaded on first use
+_LIBC = None
+
+def _clonefile(src, dst):
+    """
+    Clone a file with APFS clonefile(2), an O(1) copy-on-write copy.
+    
+    Args:
+        src (str): Source file path
+        dst (str): Target file path (must not exist)
+        
+    Returns:
+        bool: True if the file was cloned, False if cloning is not possible here
+    """
+    global _LIBC
+    if _LIBC is None:
+        _LIBC = ctypes.CDLL(None, use_errno=True)
+    
+    if _LIBC.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        return True
+    
+    err = ctypes.get_errno()
+    if err in _CLONE_FALLBACK_ERRNOS:
+        return False
+    raise OSError(err, os.strerror(err), dst)
+
+def _copy_fds(fsrc, fdst, size):
+    """
+    Copy the contents of one unbuffered file object into another, trying
+    in-kernel copies first and falling back to a plain read/write loop.
+    
+    Args:
+        fsrc: Source file opened with buffering=0
+        fdst: Destination file opened with buffering=0
+        size (int): Size of the source file in bytes
+    """
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    blocksize = max(size, 8 * COPY_BUFSIZE)
+    
+    # copy_file_range (Linux >= 4.5) can reflink on btrfs/XFS and never leaves the kernel
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, blocksize) > 0:
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    
+    # sendfile continues from the current file offsets if copy_file_range stopped part way
+    if hasattr(os, "sendfile"):
+        try:
+            while os.sendfile(dst_fd, src_fd, None, blocksize) > 0:
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    
+    # Plain read/write loop with a single preallocated buffer
+    with memoryview(bytearray(COPY_BUFSIZE)) as buf:
+        while n := fsrc.readinto(buf):
+            view = buf[:n]
+            while view:
+                view = view[fdst.write(view):]
+
+def _fast_copy(src, dst):
+    """
+    Copy a file using the fastest method the platform offers, preserving
+    timestamps and permission bits like shutil.copy2.
+    
+    Args:
+        src (str): Source file path
+        dst (str): Target file path
+    """
+    st = os.stat(src)
+    
+    if sys.platform.startswith("linux"):
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            try:
+                # Reflink shares the source extents, so the copy is O(1) regardless of size
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError as e:
+                if e.errno not in _CLONE_FALLBACK_ERRNOS:
+                    raise
+                _copy_fds(fsrc, fdst, st.st_size)
+    elif sys.platform == "darwin" and _clonefile(src, dst):
+        pass
+    else:
+        # shutil.copyfile already uses fcopyfile on macOS and CopyFile2 on Windows
+        shutil.copyfile(src, dst)
+    
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+def _fast_copy_one(pair):
+    """
+    Copy a single (source, target) pair, reporting the outcome instead of raising.
+    
+    Args:
+        pair (tuple): (source_file, target_file)
+        
+    Returns:
+        tuple: (source_file, target_file, error) where error is None on success
+    """
+    source_file, target_file = pair
+    try:
+        _fast_copy(source_file, target_file)
+        return source_file, target_file, None
+    except Exception as e:
+        return source_file, target_file, e
+
+def _flush_log(log_buf):
+    """Write all buffered log lines to stdout in one call and empty the buffer."""
+    if log_buf:
+        sys.stdout.write(''.join(log_buf))
+        sys.stdout.flush()
+        log_buf.clear()
+
+def _log(log_buf, line):
+    """Buffer a per-file log line, flushing once LOG_FLUSH_EVERY lines are pending."""
+    log_buf.append(line + '\n')
+    if len(log_buf) >= LOG_FLUSH_EVERY:
+        _flush_log(log_buf)
+
+def _ensure_target_dir(path, created):
+    """
+    Create a target directory once per run. When its parent is already known
+    to exist, a single mkdir replaces makedirs' stat chain up the tree.
+    
+    Args:
+        path (str): Directory to create
+        created (set): Directories already created or known to exist; updated in place
+    """
+    if path in created:
+        return
+    
+    if os.path.dirname(path) in created:
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+    else:
+        os.makedirs(path, exist_ok=True)
+    
+    created.add(path)
+
+def _iter_webp(root):
+    """
+    Walk a directory tree with os.scandir and yield every .webp file, using
+    the type information scandir already returns instead of extra stat calls.
+    
+    Args:
+        root (str): Directory to walk
+        
+    Yields:
+        tuple: (file_path, file_name, rel_dir) where rel_dir is relative to root ('' for root itself)
+    """
+    stack = [(root, '')]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Plain string concatenation; entry.path already carries the full child path
+                    stack.append((entry.path, f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name))
+                elif entry.name.endswith('.webp'):
+                    yield entry.path, entry.name, rel_dir
+
+def copy_translated_bubbles(language, source_dir=None, target_dir=None, overwrite=False, workers=None):
     """
     Copy translated speech bubbles from the translation project to the game assets directory.
     
@@ -24,6 +223,7 @@ def copy_translated_bubbles(language, source_dir=None, target_dir=None, overwrit
         source_dir (str): Source directory containing translated speech bubbles
         target_dir (str): Target directory in the game assets
         overwrite (bool): Whether to overwrite existing files
+        workers (int): Number of copy threads (raise to 16-32 for network targets)
     """
     # Set default directories if not specified
     if source_dir is None:
@@ -52,46 +252,66 @@ def copy_translated_bubbles(language, source_dir=None, target_dir=None, overwrit
     files_skipped = 0
     errors = 0
     
+    # Per-file log lines, written to stdout in batches instead of one print per file
+    log_buf = []
+    
+    # (source_file, target_file) pairs collected during the walk and copied afterwards
+    pairs = []
+    
+    # Relative directory whose target subdirectory is currently prepared
+    current_rel_path = None
+    
+    # Target directories known to exist, seeded with the (validated) target root
+    created_dirs = {os.path.dirname(os.path.join(target_dir, ''))}
+    
     # Walk through the source directory
-    for root, dirs, files in os.walk(source_dir):
-        # Get the relative path from the source directory
-        rel_path = os.path.relpath(root, source_dir)
-        
-        # Skip the root directory itself
-        if rel_path == '.':
+    for source_file, file, rel_path in _iter_webp(source_dir):
+        # Skip files in the root directory itself
+        if not rel_path:
             continue
         
-        # Create the corresponding target directory
-        target_subdir = os.path.join(target_dir, rel_path)
-        os.makedirs(target_subdir, exist_ok=True)
+        # Files of one directory arrive together, so set up its target once
+        if rel_path != current_rel_path:
+            current_rel_path = rel_path
+            
+            # Create the corresponding target directory
+            target_subdir = os.path.join(target_dir, rel_path)
+            _ensure_target_dir(target_subdir, created_dirs)
+            
+            # List the target directory once instead of stat-ing every candidate file
+            with os.scandir(target_subdir) as entries:
+                existing = {entry.name for entry in entries}
+            
+            # Joined once per directory; file paths below are built by concatenation
+            target_prefix = os.path.join(target_subdir, '')
+        
+        # Extract the base name (e.g., 'spch-0-En-US.webp' -> 'spch-0')
+        parts = file.split('-', 2)
+        base_name = f"{parts[0]}-{parts[1].split('.', 1)[0]}"
+        
+        # Create the target filename with language suffix
+        target_name = f"{base_name}-{language}.webp"
+        target_file = target_prefix + target_name
         
-        # Process each file in the current directory
-        for file in files:
-            # Only process webp files
-            if file.endswith('.webp'):
-                source_file = os.path.join(root, file)
-                
-                # Extract the base name (e.g., 'spch-0-En-US.webp' -> 'spch-0')
-                base_name = file.split('-')[0] + '-' + file.split('-')[1].split('.')[0]
-                
-                # Create the target filename with language suffix
-                target_file = os.path.join(target_subdir, f"{base_name}-{language}.webp")
-                
-                # Check if target file already exists
-                if os.path.exists(target_file) and not overwrite:
-                    print(f"{YELLOW}Skipping: {target_file} (already exists){RESET}")
-                    files_skipped += 1
-                    continue
-                
-                try:
-                    # Copy the file
-                    shutil.copy2(source_file, target_file)
-                    print(f"{GREEN}Copied: {source_file} -> {target_file}{RESET}")
-                    files_copied += 1
-                except Exception as e:
-                    print(f"{RED}Error copying {source_file}: {str(e)}{RESET}")
-                    errors += 1
+        # Check if target file already exists
+        if target_name in existing and not overwrite:
+            _log(log_buf, f"{YELLOW}Skipping: {target_file} (already exists){RESET}")
+            files_skipped += 1
+            continue
+        
+        pairs.append((source_file, target_file))
+    
+    # Copies are independent, so keep several in flight to overlap their I/O
+    with ThreadPoolExecutor(max_workers=workers or DEFAULT_COPY_WORKERS) as executor:
+        for source_file, target_file, error in executor.map(_fast_copy_one, pairs):
+            if error is None:
+                _log(log_buf, f"{GREEN}Copied: {source_file} -> {target_file}{RESET}")
+                files_copied += 1
+            else:
+                _log(log_buf, f"{RED}Error copying {source_file}: {str(error)}{RESET}")
+                errors += 1
     
+    _flush_log(log_buf)
     print(LOG_SEPARATOR)
     print(f"{MAGENTA}Copy operation complete:{RESET}")
     print(f"{GREEN}✓ Files copied: {files_copied}{RESET}")
@@ -106,6 +326,7 @@ def main():
     parser.add_argument("--source", "-s", help="Source directory containing translated speech bubbles")
     parser.add_argument("--target", "-t", help="Target directory in the game assets")
     parser.add_argument("--overwrite", "-o", action="store_true", help="Overwrite existing files")
+    parser.add_argument("--workers", "-j", type=int, default=DEFAULT_COPY_WORKERS, help=f"Number of parallel copy threads (default: {DEFAULT_COPY_WORKERS})")
     
     args = parser.parse_args()
     
@@ -115,7 +336,7 @@ def main():
         source_dir = f"/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/final/{args.language}"
     
     # Copy the translated bubbles
-    copy_translated_bubbles(args.language, source_dir, args.target, args.overwrite)
+    copy_translated_bubbles(args.language, source_dir, args.target, args.overwrite, args.workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
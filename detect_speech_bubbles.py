@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 import os
+import sys
 import json
+import argparse
+import multiprocessing
+from functools import partial
 import cv2
 import numpy as np
 import pytesseract
+from PIL import Image
 from pathlib import Path
 import re
 
+try:
+    # In-process libtesseract binding; avoids spawning a tesseract subprocess per call
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
 # Directory containing the speech bubble images
 SOURCE_DIR = "/Users/robertsbrinkis/Documents/work/gamebook/Spreads/GIMP"
 # Output directory for JSON files
@@ -14,6 +25,8 @@ OUTPUT_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/med
 # Regex pattern for valid Spanish text (letters, numbers, punctuation, and spaces)
 # Modified to properly handle Spanish words with punctuation
 SPANISH_TEXT_PATTERN = r'^[a-zA-Z0-9áéíóúÁÉÍÓÚñÑüÜ¿¡.,;:()\-\'\"\s?!]+$'
+# Compiled once at import; called for every OCR token
+SPANISH_TEXT_MATCH = re.compile(SPANISH_TEXT_PATTERN).match
 
 # ANSI color codes for better logging
 RED = "\033[91m"
@@ -27,98 +40,282 @@ RESET = "\033[0m"
 # Log separator
 LOG_SEPARATOR = f"{YELLOW}{'—' * 50}{RESET}"
 
+# Consolidated output file used with --jsonl (one JSON object per line)
+BOUNDS_JSONL_FILENAME = "bounds.jsonl"
+
+# Tesseract page segmentation modes, tried in order until one yields text
+PSM_MODES = [6, 11, 3]
+
+# Shared tesserocr handle, created on first use and reused for every image
+_TESS_API = None
+
+# Grayscale standard deviation above which an image is already high-contrast and CLAHE is skipped
+CLAHE_SKIP_STD = 55
+
+# CPU CLAHE operator, shared by every image instead of being rebuilt per call
+_CLAHE = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+
+# Per-process CUDA state; probed lazily so the CUDA driver is never initialised before the pool forks
+_CUDA_AVAILABLE = None
+_CUDA_STREAM = None
+_CUDA_CLAHE = None
+
 def ensure_directory_exists(directory):
     """Ensure the specified directory exists."""
     os.makedirs(directory, exist_ok=True)
     print(f"{BLUE}Directory ensured: {directory}{RESET}")
 
+def _iter_speech_bubbles(directory):
+    """
+    Walk a directory tree with os.scandir and yield the path of every
+    spch-*.webp file. Names are tested on the DirEntry before any type
+    check, and scandir's cached type information avoids the extra stat
+    calls of os.walk.
+    """
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name[:5] == "spch-" and name[-5:] == ".webp":
+                    if entry.is_file():
+                        yield entry.path
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
 def get_speech_bubble_files(directory):
     """Get all speech bubble files from the specified directory structure."""
-    speech_bubble_files = []
-    
-    # Walk through all subdirectories
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            # Only process files that match the pattern spch-*.webp
-            if file.startswith("spch-") and file.endswith(".webp"):
-                speech_bubble_files.append(os.path.join(root, file))
-    
-    return speech_bubble_files
-
-def detect_text_regions(image_path):
-    """Detect text regions in the image using Tesseract OCR."""
-    # Read the image
-    image = cv2.imread(image_path)
-    if image is None:
+    # Walk through all subdirectories, keeping only files that match spch-*.webp
+    return list(_iter_speech_bubbles(directory))
+
+def get_tesseract_api():
+    """Return the shared tesserocr API handle, loading the Spanish model on first use."""
+    global _TESS_API
+    if _TESS_API is None:
+        _TESS_API = PyTessBaseAPI(lang='spa', psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+    return _TESS_API
+
+def init_ocr_worker():
+    """Pool initializer: load the Tesseract model once in each worker process."""
+    if PyTessBaseAPI is not None:
+        get_tesseract_api()
+
+def prepare_ocr_image(image):
+    """
+    Prepare a grayscale image for OCR once, so repeated passes with different
+    page segmentation modes don't redo the conversion.
+    
+    With tesserocr the raw pixel buffer is handed to the shared API directly;
+    with pytesseract the image is converted to PIL once.
+    
+    Args:
+        image (ndarray): Grayscale image
+        
+    Returns:
+        The image object to pass to ocr_words/ocr_text
+    """
+    if PyTessBaseAPI is None:
+        return Image.fromarray(image)
+    
+    height, width = image.shape
+    image = np.ascontiguousarray(image)
+    get_tesseract_api().SetImageBytes(image.tobytes(), width, height, 1, width)
+    return image
+
+def set_page_seg_mode(api, image, psm):
+    """Switch the tesserocr PSM, discarding the previous layout analysis so the new mode takes effect."""
+    api.SetPageSegMode(psm)
+    # SetRectangle clears the cached results without re-sending the image
+    height, width = image.shape
+    api.SetRectangle(0, 0, width, height)
+
+def ocr_words(image, psm):
+    """
+    Run word-level OCR on an image prepared by prepare_ocr_image.
+    
+    Args:
+        image: Image returned by prepare_ocr_image
+        psm (int): Tesseract page segmentation mode
+        
+    Returns:
+        dict: pytesseract-style dict with 'text', 'conf', 'left', 'top', 'width' and 'height' lists
+    """
+    if PyTessBaseAPI is None:
+        custom_config = f'--oem 3 --psm {psm} -l spa'
+        return pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
+    
+    api = get_tesseract_api()
+    set_page_seg_mode(api, image, psm)
+    api.Recognize()
+    
+    data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+    
+    for word in iterate_level(iterator, RIL.WORD):
+        box = word.BoundingBox(RIL.WORD)
+        if box is None:
+            continue
+        x1, y1, x2, y2 = box
+        data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+        data['conf'].append(word.Confidence(RIL.WORD))
+        data['left'].append(x1)
+        data['top'].append(y1)
+        data['width'].append(x2 - x1)
+        data['height'].append(y2 - y1)
+    
+    return data
+
+def ocr_text(image, psm):
+    """Run OCR on an image prepared by prepare_ocr_image and return the recognized text as a single string."""
+    if PyTessBaseAPI is None:
+        custom_config = f'--oem 3 --psm {psm} -l spa'
+        return pytesseract.image_to_string(image, config=custom_config)
+    
+    api = get_tesseract_api()
+    set_page_seg_mode(api, image, psm)
+    return api.GetUTF8Text()
+
+def cuda_available():
+    """Check once per process whether OpenCV was built with CUDA and a GPU is present."""
+    global _CUDA_AVAILABLE
+    if _CUDA_AVAILABLE is None:
+        try:
+            _CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            _CUDA_AVAILABLE = False
+    return _CUDA_AVAILABLE
+
+def read_grayscale(image_path):
+    """
+    Read an image straight into grayscale with a single read() and decode.
+    
+    Args:
+        image_path (str): Path to the image
+        
+    Returns:
+        ndarray: Grayscale image, or None if it could not be read or decoded
+    """
+    try:
+        with open(image_path, 'rb', buffering=0) as f:
+            buf = np.frombuffer(f.read(), np.uint8)
+    except OSError:
+        return None
+    return cv2.imdecode(buf, cv2.IMREAD_GRAYSCALE)
+
+def enhance_contrast(gray):
+    """
+    Boost the contrast of a grayscale image with CLAHE, on the GPU when one is available.
+    
+    Args:
+        gray (ndarray): Grayscale image
+        
+    Returns:
+        ndarray: Contrast-enhanced grayscale image (the input itself if it is already high-contrast)
+    """
+    global _CUDA_STREAM, _CUDA_CLAHE
+    
+    # Equalization doesn't help images that already use most of the range
+    _, std = cv2.meanStdDev(gray)
+    if std[0, 0] > CLAHE_SKIP_STD:
+        return gray
+    
+    if cuda_available():
+        if _CUDA_STREAM is None:
+            _CUDA_STREAM = cv2.cuda.Stream()
+            _CUDA_CLAHE = cv2.cuda.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+        gpu_gray = cv2.cuda_GpuMat()
+        gpu_gray.upload(gray, stream=_CUDA_STREAM)
+        enhanced = _CUDA_CLAHE.apply(gpu_gray, _CUDA_STREAM).download(stream=_CUDA_STREAM)
+        _CUDA_STREAM.waitForCompletion()
+        return enhanced
+    
+    # Increase contrast
+    return _CLAHE.apply(gray)
+
+def detect_text_regions(image_path, verbose=True):
+    """
+    Detect text regions in the image using Tesseract OCR.
+    
+    Args:
+        image_path (str): Path to the speech bubble image
+        verbose (bool): Whether to log every accepted and rejected token
+        
+    Returns:
+        list: Bounding box dictionaries for the detected text
+    """
+    # Read the image, decoding directly to grayscale
+    gray = read_grayscale(image_path)
+    if gray is None:
         print(f"{RED}Error: Could not read image {image_path}{RESET}")
         return []
     
-    # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
     # Apply preprocessing to improve text detection
-    # Increase contrast
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-    enhanced = clahe.apply(gray)
+    enhanced = enhance_contrast(gray)
+    
+    # Convert once for every OCR pass below
+    ocr_image = prepare_ocr_image(enhanced)
     
     # Try multiple configurations for better detection
-    bounding_boxes = []
+    # Accepted tokens are collected as (x, y, width, height, text, confidence) rows
+    rows = []
     
-    # Try different PSM modes
-    psm_modes = [11, 6, 3]
-    for psm in psm_modes:
-        custom_config = f'--oem 3 --psm {psm} -l spa'
-        data = pytesseract.image_to_data(enhanced, config=custom_config, output_type=pytesseract.Output.DICT)
+    # Token log lines, written out together once detection finishes
+    log_lines = []
+    
+    # Start with a single-block pass; the other PSM modes are only tried when it finds nothing
+    for psm in PSM_MODES:
+        data = ocr_words(ocr_image, psm)
         
         # Extract bounding boxes for text regions
-        n_boxes = len(data['level'])
-        for i in range(n_boxes):
-            # Lower confidence threshold to 40 to catch more text
-            if int(data['conf'][i]) > 40 and data['text'][i].strip() != '':
-                text = data['text'][i].strip()
-                
-                # Filter out non-Spanish text using regex
-                if re.match(SPANISH_TEXT_PATTERN, text):
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                    bounding_boxes.append({
-                        'x': x,
-                        'y': y,
-                        'width': w,
-                        'height': h,
-                        'text': text,
-                        'confidence': int(data['conf'][i])
-                    })
-                    print(f"{GREEN}Found text: '{text}' (confidence: {int(data['conf'][i])}%){RESET}")
-                else:
-                    print(f"{YELLOW}Filtered out non-Spanish text: '{text}'{RESET}")
+        n_boxes = len(data['text'])
+        
+        # Lower confidence threshold to 40 to catch more text and drop blank tokens;
+        # both filters run over whole columns, leaving only survivors for the Python loop
+        conf = np.asarray(data['conf'], dtype=np.float64)
+        texts = np.asarray(data['text'], dtype=str)
+        nonempty = np.char.str_len(np.char.strip(texts)) > 0
+        keep_idx = np.flatnonzero(nonempty & (np.trunc(conf) > 40))
+        
+        for i in keep_idx.tolist():
+            text = data['text'][i].strip()
+            
+            # Filter out non-Spanish text using regex
+            if SPANISH_TEXT_MATCH(text):
+                rows.append((data['left'][i], data['top'][i], data['width'][i], data['height'][i], text, int(data['conf'][i])))
+                if verbose:
+                    log_lines.append(f"{GREEN}Found text: '{text}' (confidence: {int(data['conf'][i])}%){RESET}\n")
+            elif verbose:
+                log_lines.append(f"{YELLOW}Filtered out non-Spanish text: '{text}'{RESET}\n")
         
         # If we found text, no need to try other PSM modes
-        if bounding_boxes:
+        if rows:
             break
     
     # If still no text detected, try direct OCR on the whole image
-    if not bounding_boxes:
+    if not rows:
         # Try direct OCR with different config
-        custom_config = '--oem 3 --psm 4 -l spa'
-        text = pytesseract.image_to_string(enhanced, config=custom_config).strip()
+        text = ocr_text(ocr_image, 4).strip()
         
-        if text and re.match(SPANISH_TEXT_PATTERN, text):
-            print(f"{GREEN}Found text using whole image OCR: '{text}'{RESET}")
+        if text and SPANISH_TEXT_MATCH(text):
+            if verbose:
+                log_lines.append(f"{GREEN}Found text using whole image OCR: '{text}'{RESET}\n")
             # Create a bounding box for the entire image with some margin
             h, w = enhanced.shape
             margin = int(min(w, h) * 0.1)
-            bounding_boxes.append({
-                'x': margin,
-                'y': margin,
-                'width': w - 2*margin,
-                'height': h - 2*margin,
-                'text': text,
-                'confidence': 70  # Assign a reasonable confidence
-            })
-    
-    return bounding_boxes
-
-def save_as_json(data, image_path, output_dir):
+            rows.append((margin, margin, w - 2*margin, h - 2*margin, text, 70))  # Assign a reasonable confidence
+    
+    if log_lines:
+        sys.stdout.write(''.join(log_lines))
+    
+    # Convert to the JSON layout only once detection is finished
+    return [
+        {'x': x, 'y': y, 'width': w, 'height': h, 'text': t, 'confidence': c}
+        for x, y, w, h, t, c in rows
+    ]
+
+def save_as_json(data, image_path, output_dir, verbose=True):
     """Save the bounding box data as JSON."""
     # Get the folder number (e.g., '0', '1', '2') from the path
     folder_name = os.path.basename(os.path.dirname(image_path))
@@ -128,19 +325,69 @@ def save_as_json(data, image_path, output_dir):
     
     # Create a structured filename for the JSON: spread-FOLDER-NUMBER_bounds.json
     # Extract the bubble number from the filename (e.g., '0' from 'spch-0')
-    bubble_number = base_name.split('-')[1]
+    bubble_number = base_name.split('-', 2)[1]
     json_filename = f"spread-{folder_name}-{bubble_number}_bounds.json"
     
     # Create the full path for the JSON file
     json_path = os.path.join(output_dir, json_filename)
     
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    # Serialize up front so the file is written with a single write() call
+    payload = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+    Path(json_path).write_bytes(payload)
     
-    print(f"{CYAN}Saved bounding box data to {json_path}{RESET}")
+    if verbose:
+        print(f"{CYAN}Saved bounding box data to {json_path}{RESET}")
     return json_path
 
+def append_as_jsonl(data, fh):
+    """Append the bounding box data as one line of a JSON Lines file."""
+    fh.write(json.dumps(data, ensure_ascii=False) + '\n')
+
+def _process_one(image_path, per_file=True):
+    """
+    Detect text in one image and build its bounds data. Runs inside a worker
+    process, so per-token logging is disabled.
+    
+    Args:
+        image_path (str): Path to the speech bubble image
+        per_file (bool): Save the bounds JSON here; otherwise return it for the parent to append
+        
+    Returns:
+        tuple: (image_path, number of text regions found, bounds data to append or None)
+    """
+    bounding_boxes = detect_text_regions(image_path, verbose=False)
+    
+    if not bounding_boxes:
+        return image_path, 0, None
+    
+    # Get folder name (e.g., '0', '1', '2')
+    folder_name = os.path.basename(os.path.dirname(image_path))
+    
+    # Get bubble number from filename (e.g., '0' from 'spch-0.webp')
+    bubble_number = os.path.basename(image_path).split('-', 2)[1].split('.', 1)[0]
+    
+    # Create a data structure for the JSON
+    data = {
+        'image': os.path.basename(image_path),
+        'path': image_path,
+        'folder': folder_name,
+        'bubble_number': bubble_number,
+        'text_regions': bounding_boxes
+    }
+    
+    if not per_file:
+        return image_path, len(bounding_boxes), data
+    
+    # Save the data as JSON
+    save_as_json(data, image_path, OUTPUT_DIR, verbose=False)
+    return image_path, len(bounding_boxes), None
+
 def main():
+    parser = argparse.ArgumentParser(description="Detect text regions in speech bubbles and save their bounds")
+    parser.add_argument("--jsonl", action="store_true",
+                        help=f"Write all bounds to a single {BOUNDS_JSONL_FILENAME} instead of one JSON file per bubble")
+    args = parser.parse_args()
+    
     print(f"{MAGENTA}Starting speech bubble detection...{RESET}")
     print(LOG_SEPARATOR)
     
@@ -152,36 +399,32 @@ def main():
     print(f"{BLUE}Found {len(speech_bubble_files)} speech bubble files{RESET}")
     print(LOG_SEPARATOR)
     
-    # Process each image
-    for i, image_path in enumerate(speech_bubble_files):
-        print(f"{MAGENTA}Processing [{i+1}/{len(speech_bubble_files)}] {image_path}...{RESET}")
-        bounding_boxes = detect_text_regions(image_path)
-        
-        if bounding_boxes:
-            # Get folder name (e.g., '0', '1', '2')
-            folder_name = os.path.basename(os.path.dirname(image_path))
-            
-            # Get bubble number from filename (e.g., '0' from 'spch-0.webp')
-            bubble_number = os.path.basename(image_path).split('-')[1].split('.')[0]
-            
-            # Create a data structure for the JSON
-            data = {
-                'image': os.path.basename(image_path),
-                'path': image_path,
-                'folder': folder_name,
-                'bubble_number': bubble_number,
-                'text_regions': bounding_boxes
-            }
-            
-            # Save the data as JSON
-            save_as_json(data, image_path, OUTPUT_DIR)
-            print(f"{GREEN}✓ Successfully processed with {len(bounding_boxes)} text regions{RESET}")
-        else:
-            print(f"{RED}✗ No text regions detected in {image_path}{RESET}")
-        
-        print(LOG_SEPARATOR)
+    # With --jsonl every result is appended to one sequential stream instead of its own file
+    jsonl_file = None
+    if args.jsonl:
+        jsonl_path = os.path.join(OUTPUT_DIR, BOUNDS_JSONL_FILENAME)
+        jsonl_file = open(jsonl_path, 'w', encoding='utf-8', buffering=1 << 20)
     
+    try:
+        # OCR is CPU-bound and independent per image, so spread it across all cores
+        with multiprocessing.Pool(processes=os.cpu_count(), initializer=init_ocr_worker) as pool:
+            worker = partial(_process_one, per_file=not args.jsonl)
+            results = pool.imap_unordered(worker, speech_bubble_files, chunksize=4)
+            for i, (image_path, n_boxes, data) in enumerate(results):
+                if data is not None:
+                    append_as_jsonl(data, jsonl_file)
+                
+                if n_boxes:
+                    print(f"{GREEN}✓ [{i+1}/{len(speech_bubble_files)}] {image_path}: {n_boxes} text regions{RESET}")
+                else:
+                    print(f"{RED}✗ [{i+1}/{len(speech_bubble_files)}] No text regions detected in {image_path}{RESET}")
+    finally:
+        if jsonl_file is not None:
+            jsonl_file.close()
+            print(f"{CYAN}Saved bounding box data to {jsonl_path}{RESET}")
+    
+    print(LOG_SEPARATOR)
     print(f"{MAGENTA}Speech bubble detection completed!{RESET}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
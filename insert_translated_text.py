@@ -2,23 +2,35 @@
 import os
 import json
 import argparse
-import textwrap
-import cv2
+import functools
+import string
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import re
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Faster parser for the many small bounds/translation files; the stdlib
+    # json.loads accepts the same bytes input when orjson is not installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Font settings
 FONT_PATH = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/McLaren-Regular.ttf"
 FONT_SIZE = 16
 TEXT_COLOR = (0, 0, 0)  # Black
 
+# WebP output settings: method 0 is the fastest encoder, quality 90 keeps the
+# lettering crisp; encoding dominates once text fitting is cached
+WEBP_SAVE_OPTIONS = {"format": "WEBP", "method": 0, "quality": 90}
+
 ## Directories
 FINAL_BOUNDS_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/bounds/final-bounds"
 BLANK_BUBBLES_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/blanks"
 TRANSLATED_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/translated"
 BASE_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate"
+_BASE_PREFIX = os.path.join(BASE_DIR, "")
 
 # ANSI color codes
 RED = "\033[91m"
@@ -37,6 +49,11 @@ WARNING_COUNT = 0
 
 def get_relative_path(path):
     """Convert absolute path to relative path from BASE_DIR"""
+    # Paths under BASE_DIR only need the prefix sliced off; relpath normalizes
+    # both paths and is only worth it for anything else
+    path = os.fspath(path)
+    if path.startswith(_BASE_PREFIX):
+        return path[len(_BASE_PREFIX):]
     try:
         return os.path.relpath(path, BASE_DIR)
     except:
@@ -58,54 +75,54 @@ def find_speech_bubble_bounds(image_path):
     Returns:
         tuple: (x, y, width, height) of the speech bubble bounds
     """
-    # Open image with PIL to handle transparency
+    # Open image with PIL to handle transparency (only the header is read here)
     pil_img = Image.open(image_path)
     
+    # If no alpha channel, use the entire image without decoding the pixels
+    if pil_img.mode != "RGBA":
+        return (0, 0, pil_img.width, pil_img.height)
+    
     # Convert to numpy array
-    img = np.array(pil_img)
+    img = np.asarray(pil_img)
     
-    # If the image has an alpha channel, use it to find the bubble
-    if img.shape[2] == 4:
-        # Extract alpha channel
-        alpha = img[:, :, 3]
-        
-        # Threshold the alpha channel to get a binary mask of the bubble
-        _, binary = cv2.threshold(alpha, 240, 255, cv2.THRESH_BINARY)
-        
-        # Find contours in the binary image
-        contours, _ = cv2.findContours(
-            binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
-        
-        # If no contours found, return the full image bounds
-        if not contours:
-            return (0, 0, img.shape[1], img.shape[0])
-        
-        # Find the largest contour (assuming it's the speech bubble)
-        largest_contour = max(contours, key=cv2.contourArea)
-        
-        # Get bounding rectangle
-        x, y, w, h = cv2.boundingRect(largest_contour)
-        
-        # Add some padding (10% of width/height)
-        padding_x = int(w * 0.1)
-        padding_y = int(h * 0.1)
-        
-        # Ensure bounds don't exceed image dimensions
-        x = max(0, x + padding_x)
-        y = max(0, y + padding_y)
-        w = min(img.shape[1] - x, w - 2 * padding_x)
-        h = min(img.shape[0] - y, h - 2 * padding_y)
-        
-        return (x, y, w, h)
-    else:
-        # If no alpha channel, use the entire image
+    # Extract alpha channel
+    alpha = img[:, :, 3]
+    
+    # Opaque pixels make up the bubble
+    mask = alpha > 240
+    rows = np.any(mask, axis=1)
+    cols = np.any(mask, axis=0)
+    
+    # If nothing is opaque, return the full image bounds
+    if not rows.any():
         return (0, 0, img.shape[1], img.shape[0])
+    
+    # First and last opaque row/column give the bounding rectangle
+    ymin = int(np.argmax(rows))
+    ymax = len(rows) - 1 - int(np.argmax(rows[::-1]))
+    xmin = int(np.argmax(cols))
+    xmax = len(cols) - 1 - int(np.argmax(cols[::-1]))
+    x, y = xmin, ymin
+    w, h = xmax - xmin + 1, ymax - ymin + 1
+    
+    # Add some padding (10% of width/height)
+    padding_x = int(w * 0.1)
+    padding_y = int(h * 0.1)
+    
+    # Ensure bounds don't exceed image dimensions
+    x = max(0, x + padding_x)
+    y = max(0, y + padding_y)
+    w = min(img.shape[1] - x, w - 2 * padding_x)
+    h = min(img.shape[0] - y, h - 2 * padding_y)
+    
+    return (x, y, w, h)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_processed_bounds(spread_num, bubble_num):
     """
     Get the processed bounds from the final-bounds directory.
+    Results are cached, so treat the returned list as read-only.
     
     Args:
         spread_num (int): Spread number
@@ -122,8 +139,8 @@ def get_processed_bounds(spread_num, bubble_num):
     
     # Check if the file exists
     if os.path.exists(bounds_file):
-        with open(bounds_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(bounds_file, 'rb') as f:
+            data = json_loads(f.read())
             return data.get('bubbles', [])
     
     # If the file doesn't exist, try the original bounds file
@@ -136,115 +153,148 @@ def get_processed_bounds(spread_num, bubble_num):
     
     return None
 
-def fit_text_to_bubble(draw, text, font_path, bubble_width, bubble_height, font_size=FONT_SIZE):
+@functools.lru_cache(maxsize=128)
+def _get_font(font_path, size):
     """
-    Find the optimal way to fit the text within the bubble using the specified font size.
+    Load a TrueType font once per (path, size) and reuse it afterwards.
     
     Args:
-        draw (ImageDraw): ImageDraw object
-        text (str): Text to fit
         font_path (str): Path to the font file
-        bubble_width (int): Width of the speech bubble
-        bubble_height (int): Height of the speech bubble
-        font_size (int): Font size to use
+        size (int): Font size
         
     Returns:
-        tuple: (Font, list of text lines, line height)
+        FreeTypeFont: The loaded font
     """
-    # Start with a reasonable font size
-    min_font_size = 12
-    max_font_size = 64  # Upper limit to prevent extremely large text
+    return ImageFont.truetype(font_path, size)
+
+
+@functools.lru_cache(maxsize=512)
+def _line_height(font_path, size):
+    """Line height for a font: the height of "Tg" plus 4 pixels of spacing."""
+    return _get_font(font_path, size).getbbox("Tg")[3] + 4
+
+
+@functools.lru_cache(maxsize=128)
+def _advance_table(font_path, size):
+    """
+    Build a table of horizontal glyph advances for a font, used to estimate
+    line widths with dict lookups instead of a FreeType call per character.
     
-    # Try different font sizes to find the best fit with word wrapping
-    for test_size in range(max_font_size, min_font_size - 1, -1):
-        font = ImageFont.truetype(font_path, test_size)
-        line_height = font.getbbox("Tg")[3] + 4  # Add space between lines
-        
-        # First try to wrap without breaking words
-        lines = textwrap.wrap(text, width=int(bubble_width * 0.9 / font.getbbox("m")[2]))
-        
-        # Calculate total height needed
-        total_height = len(lines) * line_height
-        
-        # Check if all lines fit within the bubble width and the total height fits
-        all_lines_fit = True
-        for line in lines:
-            if font.getbbox(line)[2] > bubble_width * 0.95:
-                all_lines_fit = False
-                break
-        
-        # If text fits both width and height constraints, use this font size
-        if all_lines_fit and total_height <= bubble_height * 0.95:
-            return font, lines, line_height
-        
-        # If it doesn't fit, try with hyphenation
-        lines = []
-        words = text.split()
-        current_line = ""
+    The table starts with the printable ASCII characters; any other character
+    (accented letters etc.) is measured on first use and added.
+    
+    Args:
+        font_path (str): Path to the font file
+        size (int): Font size
         
-        for word in words:
-            # Skip empty words
-            if not word:
-                continue
-                
-            # Try adding the word to the current line
-            test_line = current_line + " " + word if current_line else word
-            
-            # Check if it fits
-            if font.getbbox(test_line)[2] <= bubble_width * 0.95:
-                current_line = test_line
-            else:
-                # If the word is too long, hyphenate it
-                if font.getbbox(word)[2] > bubble_width * 0.95:
-                    # Add the current line if it's not empty
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = ""
-                    
-                    # Hyphenate the long word
-                    remaining_word = word
-                    while remaining_word:
-                        found_fit = False
-                        for i in range(len(remaining_word), 0, -1):
-                            test_segment = remaining_word[:i]
-                            if i < len(remaining_word):
-                                test_segment += "-"
-                            
-                            if font.getbbox(test_segment)[2] <= bubble_width * 0.95:
-                                lines.append(test_segment)
-                                remaining_word = remaining_word[i:]
-                                found_fit = True
-                                break
-                        
-                        # If we couldn't find any fit, force break the first character
-                        # Only try to access remaining_word[0] if remaining_word is not empty
-                        if not found_fit:
-                            if remaining_word:  # Check if remaining_word is not empty
-                                lines.append(remaining_word[0])
-                                remaining_word = remaining_word[1:] if len(remaining_word) > 1 else ""
-                            else:
-                                # If we somehow got here with an empty string, break the loop
-                                break
-                else:
-                    # Add the current line and start a new one with this word
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
+    Returns:
+        dict: Mapping of character to advance width in pixels
+    """
+    font = _get_font(font_path, size)
+    return {char: font.getlength(char) for char in string.printable}
+
+
+def _estimate_width(table, font, text):
+    """Sum the advances of the characters in text, measuring unseen characters once."""
+    try:
+        # Fast path: every character is already in the table, so the sum runs in C
+        return sum(map(table.__getitem__, text))
+    except KeyError:
+        pass
+    
+    width = 0
+    for char in text:
+        advance = table.get(char)
+        if advance is None:
+            advance = table[char] = font.getlength(char)
+        width += advance
+    return width
+
+
+def _pixel_wrap(text, font_path, size, max_width):
+    """
+    Wrap text into lines no wider than max_width pixels without breaking words.
+    
+    Line breaks are estimated from the font's advance table, then each line is
+    measured once and shrunk word by word if kerning pushed it over the limit.
+    
+    Args:
+        text (str): Text to wrap
+        font_path (str): Path to the font file
+        size (int): Font size
+        max_width (float): Maximum line width in pixels
         
-        # Add the last line if there's anything left
-        if current_line:
-            lines.append(current_line)
+    Returns:
+        list: Wrapped lines, or None if a single word is wider than max_width
+    """
+    font = _get_font(font_path, size)
+    table = _advance_table(font_path, size)
+    space_width = table[" "]
+    words = text.split()
+    word_widths = [_estimate_width(table, font, word) for word in words]
+    
+    lines = []
+    start = 0
+    while start < len(words):
+        # Estimate: extend the line while the summed advances still fit
+        end = start + 1
+        line_width = word_widths[start]
+        while end < len(words) and line_width + space_width + word_widths[end] <= max_width:
+            line_width += space_width + word_widths[end]
+            end += 1
+        
+        # Adjust: measure the real line and give words back until it fits
+        while font.getbbox(" ".join(words[start:end]))[2] > max_width:
+            if end - start == 1:
+                return None
+            end -= 1
+        
+        lines.append(" ".join(words[start:end]))
+        start = end
+    
+    return lines
+
+
+def _longest_fitting_prefix(font, word, max_width):
+    """
+    Binary-search the longest prefix of a word that fits within max_width,
+    counting the trailing hyphen added when the word is split.
+    
+    Args:
+        font (FreeTypeFont): Font used for measuring
+        word (str): Word to split
+        max_width (float): Maximum line width in pixels
         
-        # Check if the hyphenated version fits
-        total_height = len(lines) * line_height
-        if total_height <= bubble_height * 0.95:
-            return font, lines, line_height
+    Returns:
+        int: Length of the longest fitting prefix, or 0 if not even one character fits
+    """
+    lo, hi = 0, len(word)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        segment = word[:mid] + ("-" if mid < len(word) else "")
+        if font.getbbox(segment)[2] <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _wrap_with_hyphenation(text, font, bubble_width):
+    """
+    Wrap text word by word, hyphenating any word too long for a line.
     
-    # If we get here, use the smallest font size with hyphenation
-    font = ImageFont.truetype(font_path, min_font_size)
-    line_height = font.getbbox("Tg")[3] + 4
+    Args:
+        text (str): Text to wrap
+        font (ImageFont.FreeTypeFont): Font used for measuring
+        bubble_width (int): Width of the speech bubble
+        
+    Returns:
+        list: Text lines
+    """
+    # Hoisted out of the loop: the limit and the bound measuring method
+    max_width = bubble_width * 0.95
+    getbbox = font.getbbox
     
-    # Apply the same hyphenation logic with the smallest font
     lines = []
     words = text.split()
     current_line = ""
@@ -254,31 +304,32 @@ def fit_text_to_bubble(draw, text, font_path, bubble_width, bubble_height, font_
         if not word:
             continue
             
+        # Try adding the word to the current line
         test_line = current_line + " " + word if current_line else word
         
-        if font.getbbox(test_line)[2] <= bubble_width * 0.95:
+        # Check if it fits
+        if getbbox(test_line)[2] <= max_width:
             current_line = test_line
         else:
-            if font.getbbox(word)[2] > bubble_width * 0.95:
+            # If the word is too long, hyphenate it
+            if getbbox(word)[2] > max_width:
+                # Add the current line if it's not empty
                 if current_line:
                     lines.append(current_line)
                     current_line = ""
                 
+                # Hyphenate the long word
                 remaining_word = word
                 while remaining_word:
                     found_fit = False
-                    for i in range(len(remaining_word), 0, -1):
-                        test_segment = remaining_word[:i]
-                        if i < len(remaining_word):
-                            test_segment += "-"
-                        
-                        if font.getbbox(test_segment)[2] <= bubble_width * 0.95:
-                            lines.append(test_segment)
-                            remaining_word = remaining_word[i:]
-                            found_fit = True
-                            break
+                    i = _longest_fitting_prefix(font, remaining_word, max_width)
+                    if i:
+                        lines.append(remaining_word[:i] + ("-" if i < len(remaining_word) else ""))
+                        remaining_word = remaining_word[i:]
+                        found_fit = True
                     
                     # If we couldn't find any fit, force break the first character
+                    # Only try to access remaining_word[0] if remaining_word is not empty
                     if not found_fit:
                         if remaining_word:  # Check if remaining_word is not empty
                             lines.append(remaining_word[0])
@@ -287,14 +338,129 @@ def fit_text_to_bubble(draw, text, font_path, bubble_width, bubble_height, font_
                             # If we somehow got here with an empty string, break the loop
                             break
             else:
+                # Add the current line and start a new one with this word
                 if current_line:
                     lines.append(current_line)
                 current_line = word
     
+    # Add the last line if there's anything left
     if current_line:
         lines.append(current_line)
     
-    return font, lines, line_height
+    return lines
+
+
+def _fit_at_size(text, font_path, size, bubble_width, bubble_height):
+    """
+    Try to fit the text in the bubble at one font size, first by word
+    wrapping and then with hyphenation of over-long words.
+    
+    Args:
+        text (str): Text to fit
+        font_path (str): Path to the font file
+        size (int): Font size to try
+        bubble_width (int): Width of the speech bubble
+        bubble_height (int): Height of the speech bubble
+        
+    Returns:
+        list: Text lines if they fit, otherwise None
+    """
+    font = _get_font(font_path, size)
+    line_height = _line_height(font_path, size)  # Includes space between lines
+    
+    # First try to wrap by pixel width without breaking words
+    lines = _pixel_wrap(text, font_path, size, bubble_width * 0.95)
+    
+    # If text fits both width and height constraints, use this font size
+    if lines is not None and len(lines) * line_height <= bubble_height * 0.95:
+        return lines
+    
+    # If it doesn't fit, try with hyphenation
+    lines = _wrap_with_hyphenation(text, font, bubble_width)
+    
+    # Check if the hyphenated version fits
+    total_height = len(lines) * line_height
+    if total_height <= bubble_height * 0.95:
+        return lines
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def fit_text_to_bubble(text, font_path, bubble_width, bubble_height, font_size=FONT_SIZE):
+    """
+    Find the optimal way to fit the text within the bubble using the specified font size.
+    Results are cached on the layout inputs, so repeated strings are only wrapped once.
+    
+    Args:
+        text (str): Text to fit
+        font_path (str): Path to the font file
+        bubble_width (int): Width of the speech bubble
+        bubble_height (int): Height of the speech bubble
+        font_size (int): Font size to use
+        
+    Returns:
+        tuple: (Font, tuple of text lines, line height)
+    """
+    # Start with a reasonable font size
+    min_font_size = 12
+    max_font_size = 64  # Upper limit to prevent extremely large text
+    
+    # Fitting is monotonic in size (if a size fits, every smaller one does too),
+    # so binary-search the largest fitting size instead of trying each in turn
+    best_size, best_lines = None, None
+    lo, hi = min_font_size, max_font_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        lines = _fit_at_size(text, font_path, mid, bubble_width, bubble_height)
+        if lines is not None:
+            best_size, best_lines = mid, lines
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    
+    if best_size is not None:
+        return _get_font(font_path, best_size), tuple(best_lines), _line_height(font_path, best_size)
+    
+    # If we get here, use the smallest font size with hyphenation
+    font = _get_font(font_path, min_font_size)
+    line_height = _line_height(font_path, min_font_size)
+    
+    # Apply the same hyphenation logic with the smallest font
+    lines = _wrap_with_hyphenation(text, font, bubble_width)
+    
+    return font, tuple(lines), line_height
+
+
+def _draw_one_bubble(draw, font, lines, line_height, bubble, verbose=False):
+    """
+    Draw already-fitted lines of text centered inside a single bubble.
+    
+    Args:
+        draw (ImageDraw.Draw): Drawing object bound to the loaded image
+        font (ImageFont.FreeTypeFont): Font returned by fit_text_to_bubble
+        lines (tuple): Wrapped lines of text
+        line_height (int): Height of each line in pixels
+        bubble (dict): Bubble bounds with x, y, width and height
+        verbose (bool): Print the position of every drawn line
+    """
+    x, y = bubble.get('x', 0), bubble.get('y', 0)
+    width, height = bubble.get('width', 0), bubble.get('height', 0)
+    
+    # Calculate vertical positioning (center the text block in the bubble)
+    total_text_height = len(lines) * line_height
+    y_offset = y + (height - total_text_height) // 2
+    
+    # Draw each line of text
+    for i, line in enumerate(lines):
+        # Center the line horizontally within the bubble
+        line_width = font.getbbox(line)[2]
+        x_position = x + (width - line_width) // 2
+        y_position = y_offset + i * line_height
+        
+        if verbose:
+            print(f"Drawing line {i+1}: '{line}' at position ({x_position}, {y_position})")
+        draw.text((x_position, y_position), line, fill=TEXT_COLOR, font=font)
 
 
 def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_num, font_path=FONT_PATH, font_size=FONT_SIZE, bubble_index=0):
@@ -315,10 +481,15 @@ def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_
         bool: True if successful, False otherwise
     """
     try:
-        # Open the image
+        # Open and decode the image once
         img = Image.open(blank_bubble_path)
+        img.load()
+        
+        # Palette and greyscale images take a slow drawing path, so convert
+        # once to RGB (or RGBA if the image carries transparency)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if img.has_transparency_data else "RGB")
         
-        # Create a drawing object
         draw = ImageDraw.Draw(img)
         
         # Get the processed bounds
@@ -335,7 +506,6 @@ def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_
             print(f"Warning: Bubble index {bubble_index} out of range for spread-{spread_num}-{bubble_num}, using first bubble")
             bubble = bubbles[0]
             
-        x, y = bubble['x'], bubble['y']
         width, height = bubble['width'], bubble['height']
         
         # Clean up text (remove excess whitespace)
@@ -344,27 +514,13 @@ def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_
         # Fit text to bubble with word wrapping
         max_size = min(font_size, 32)  # Cap at 32 or the specified font_size, whichever is smaller
         font, lines, line_height = fit_text_to_bubble(
-            draw, text, font_path, width, height, max_size
+            text, font_path, width, height, max_size
         )
         
         # Get the actual font size used
         actual_font_size = font.size
         
-        # Calculate vertical positioning (center the text block in the bubble)
-        total_text_height = len(lines) * line_height
-        y_offset = y + (height - total_text_height) // 2
-        
-        # Draw each line of text
-        for i, line in enumerate(lines):
-            # Calculate width of this line
-            line_width = font.getbbox(line)[2]
-            
-            # Center the line horizontally within the bubble
-            x_position = x + (width - line_width) // 2
-            y_position = y_offset + i * line_height
-            
-            # Draw the text
-            draw.text((x_position, y_position), line, fill=TEXT_COLOR, font=font)
+        _draw_one_bubble(draw, font, lines, line_height, bubble)
         
         # Remove the bounding box visualization code
         # overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
@@ -373,7 +529,7 @@ def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_
         # img = Image.alpha_composite(img.convert('RGBA'), overlay)
         
         # Save the image
-        img.save(output_path)
+        img.save(output_path, **WEBP_SAVE_OPTIONS)
         print(f"Created: {output_path} (font size: {actual_font_size}, lines: {len(lines)}, bubble: {bubble_index+1}/{len(bubbles)})")
         return True
         
@@ -382,14 +538,34 @@ def add_text_to_bubble(blank_bubble_path, text, output_path, spread_num, bubble_
         return False
 
 
-def process_bubbles(language, font_size=FONT_SIZE):
+def _iter_blank_bubbles():
+    """
+    Yield every blank bubble image under BLANK_BUBBLES_DIR.
+    
+    Returns:
+        generator: (path, spread_num, bubble_num) for each spread/spch-N_blank.webp
+    """
+    for path in Path(BLANK_BUBBLES_DIR).glob("*/spch-*_blank.webp"):
+        try:
+            spread_num = int(path.parent.name)
+            bubble_num = int(path.stem[len("spch-"):-len("_blank")])
+        except ValueError:
+            # Skip directories and files that are not numbered
+            continue
+        yield path, spread_num, bubble_num
+
+
+def process_bubbles(language, font_size=FONT_SIZE, workers=None):
     """
     Process all blank speech bubbles for a specific language.
     
     Args:
         language (str): Language code
         font_size (int): Font size to use
+        workers (int): Number of worker processes (defaults to the CPU count)
     """
+    global SUCCESS_COUNT, FAILURE_COUNT, WARNING_COUNT
+    
     # Create output directory
     output_dir = f"/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/final/{language}"
     ensure_directory_exists(output_dir)
@@ -406,55 +582,64 @@ def process_bubbles(language, font_size=FONT_SIZE):
     print(f"Processing bubbles for language: {language}")
     print(LOG_SEPARATOR)
     
-    # Walk through the blank bubbles directory
-    for root, dirs, files in os.walk(BLANK_BUBBLES_DIR):
-        # Get the spread number from the directory name
-        spread_dir = os.path.basename(root)
+    # Collect one task per image before fanning out to the worker pool
+    tasks = []
+    
+    # Find every numbered blank bubble in the spread directories
+    for path, spread_num, bubble_num in _iter_blank_bubbles():
+        # Get the processed bounds to determine how many bubbles are in this image
+        bubbles = get_processed_bounds(spread_num, bubble_num)
         
-        try:
-            spread_num = int(spread_dir)
-            
-            # Create corresponding output directory
-            spread_output_dir = os.path.join(output_dir, spread_dir)
-            ensure_directory_exists(spread_output_dir)
-            
-            # Process each blank bubble file
-            for file in files:
-                if file.endswith("_blank.webp") and file.startswith("spch-"):
-                    # Extract bubble number
-                    match = re.match(r"spch-(\d+)_blank\.webp", file)
-                    if match:
-                        bubble_num = int(match.group(1))
-                        
-                        # Get the processed bounds to determine how many bubbles are in this image
-                        bubbles = get_processed_bounds(spread_num, bubble_num)
-                        
-                        if not bubbles:
-                            print(f"{YELLOW}Warning: No processed bounds found for spread-{spread_num}-{bubble_num}{RESET}")
-                            print(LOG_SEPARATOR)
-                            continue
-                        
-                        # Input and output paths
-                        blank_bubble_path = os.path.join(root, file)
-                        output_filename = f"spch-{bubble_num}-{language}.webp"
-                        output_path = os.path.join(spread_output_dir, output_filename)
-                        
-                        print(f"Processing: {get_relative_path(blank_bubble_path)}")
-                        
-                        # Process all bubbles in the image at once
-                        process_all_bubbles_in_image(
-                            blank_bubble_path,
-                            output_path,
-                            spread_num,
-                            bubble_num,
-                            bubbles,
-                            language,
-                            font_path=FONT_PATH,
-                            font_size=font_size
-                        )
-        except ValueError:
-            # Skip directories that are not numbers
+        if not bubbles:
+            print(f"{YELLOW}Warning: No processed bounds found for spread-{spread_num}-{bubble_num}{RESET}")
+            print(LOG_SEPARATOR)
             continue
+        
+        # Create corresponding output directory
+        spread_output_dir = os.path.join(output_dir, path.parent.name)
+        ensure_directory_exists(spread_output_dir)
+        
+        # Input and output paths
+        blank_bubble_path = str(path)
+        output_filename = f"spch-{bubble_num}-{language}.webp"
+        output_path = os.path.join(spread_output_dir, output_filename)
+        
+        tasks.append((
+            blank_bubble_path,
+            output_path,
+            spread_num,
+            bubble_num,
+            bubbles,
+            language,
+            FONT_PATH,
+            font_size
+        ))
+    
+    # Images are independent, so render them in separate processes and
+    # aggregate the per-image results here
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for success, warnings in executor.map(_process_image_task, tasks):
+            WARNING_COUNT += warnings
+            if success:
+                SUCCESS_COUNT += 1
+            else:
+                FAILURE_COUNT += 1
+
+
+def _process_image_task(task):
+    """Worker entry point: unpack a task tuple for process_all_bubbles_in_image"""
+    blank_bubble_path, output_path, spread_num, bubble_num, bubbles, language, font_path, font_size = task
+    print(f"Processing: {get_relative_path(blank_bubble_path)}")
+    return process_all_bubbles_in_image(
+        blank_bubble_path,
+        output_path,
+        spread_num,
+        bubble_num,
+        bubbles,
+        language,
+        font_path=font_path,
+        font_size=font_size
+    )
 
 
 def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bubble_num, bubbles, language, font_path=FONT_PATH, font_size=FONT_SIZE):
@@ -472,15 +657,20 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
         font_size (int): Font size to use
         
     Returns:
-        bool: True if successful, False otherwise
+        tuple: (success, warnings) - True if any bubble was drawn, and the number of warnings raised
     """
-    global SUCCESS_COUNT, FAILURE_COUNT, WARNING_COUNT
+    warnings = 0
     
     try:
-        # Open the image
+        # Open and decode the image once; every bubble is drawn onto it
         img = Image.open(blank_bubble_path)
+        img.load()
+        
+        # Palette and greyscale images take a slow drawing path, so convert
+        # once to RGB (or RGBA if the image carries transparency)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if img.has_transparency_data else "RGB")
         
-        # Create a drawing object
         draw = ImageDraw.Draw(img)
         
         # Remove the overlay creation for bounding boxes
@@ -499,7 +689,7 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
             
             if not translated_text:
                 print(f"{YELLOW}Warning: No translated text found for spread-{spread_num}-{bubble_num}, bubble {bubble_index+1}{RESET}")
-                WARNING_COUNT += 1
+                warnings += 1
                 continue
                 
             # Validate bubble dimensions
@@ -510,7 +700,7 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
             # Skip bubbles with invalid dimensions
             if width <= 0 or height <= 0:
                 print(f"{YELLOW}Warning: Invalid bubble dimensions (width={width}, height={height}) for spread-{spread_num}-{bubble_num}, bubble {bubble_index+1}{RESET}")
-                WARNING_COUNT += 1
+                warnings += 1
                 continue
             
             # Clean up text (remove excess whitespace)
@@ -520,7 +710,7 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
             # Skip empty text
             if not text:
                 print(f"{YELLOW}Warning: Empty text for spread-{spread_num}-{bubble_num}, bubble {bubble_index+1}{RESET}")
-                WARNING_COUNT += 1
+                warnings += 1
                 continue
             
             try:
@@ -528,29 +718,14 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
                 # Fit text to bubble with word wrapping
                 max_size = min(font_size, 32)  # Cap at 32 or the specified font_size, whichever is smaller
                 font, lines, line_height = fit_text_to_bubble(
-                    draw, text, font_path, width, height, max_size
+                    text, font_path, width, height, max_size
                 )
                 
                 # Get the actual font size used
                 actual_font_size = font.size
                 print(f"Text fitted with font size {actual_font_size} and {len(lines)} lines")
                 
-                # Calculate vertical positioning (center the text block in the bubble)
-                total_text_height = len(lines) * line_height
-                y_offset = y + (height - total_text_height) // 2
-                
-                # Draw each line of text
-                for i, line in enumerate(lines):
-                    # Calculate width of this line
-                    line_width = font.getbbox(line)[2]
-                    
-                    # Center the line horizontally within the bubble
-                    x_position = x + (width - line_width) // 2
-                    y_position = y_offset + i * line_height
-                    
-                    print(f"Drawing line {i+1}: '{line}' at position ({x_position}, {y_position})")
-                    # Draw the text
-                    draw.text((x_position, y_position), line, fill=TEXT_COLOR, font=font)
+                _draw_one_bubble(draw, font, lines, line_height, bubble, verbose=True)
                 
                 # Remove the bounding box visualization
                 # overlay_draw.rectangle([x, y, x + width, y + height], outline=(255, 0, 0, 128), width=2)
@@ -561,31 +736,25 @@ def process_all_bubbles_in_image(blank_bubble_path, output_path, spread_num, bub
                 import traceback
                 print(f"{RED}Error processing bubble {bubble_index+1} in {get_relative_path(blank_bubble_path)}: {str(e)}{RESET}")
                 print(f"{RED}Error details: {traceback.format_exc()}{RESET}")
-                WARNING_COUNT += 1
+                warnings += 1
                 continue
         
         # Remove the overlay compositing
         # img = Image.alpha_composite(img.convert('RGBA'), overlay)
         
         # Save the image
-        img.save(output_path)
+        img.save(output_path, **WEBP_SAVE_OPTIONS)
         print(f"{GREEN}Created: {get_relative_path(output_path)} with {bubbles_processed}/{len(bubbles)} bubbles{RESET}")
         print(LOG_SEPARATOR)
         
-        if bubbles_processed > 0:
-            SUCCESS_COUNT += 1
-        else:
-            FAILURE_COUNT += 1
-            
-        return bubbles_processed > 0
+        return bubbles_processed > 0, warnings
         
     except Exception as e:
         import traceback
         print(f"{RED}Error processing {get_relative_path(blank_bubble_path)}: {str(e)}{RESET}")
         print(f"{RED}Error details: {traceback.format_exc()}{RESET}")
         print(LOG_SEPARATOR)
-        FAILURE_COUNT += 1
-        return False
+        return False, warnings
 
 
 def main():
@@ -594,6 +763,7 @@ def main():
     parser = argparse.ArgumentParser(description="Insert translated text into blank speech bubbles")
     parser.add_argument("language", help="Language code (e.g., EN-US, LV)")
     parser.add_argument("--font-size", type=int, default=FONT_SIZE, help="Font size to use")
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Number of worker processes (default: CPU count)")
     parser.add_argument("-c", "--check", action="store_true", help="Check if each blank bubble has its final bounds file without inserting text")
     
     args = parser.parse_args()
@@ -608,7 +778,7 @@ def main():
         check_final_bounds_files()
     else:
         # Process bubbles for the specified language with the specified font size
-        process_bubbles(args.language, args.font_size)
+        process_bubbles(args.language, args.font_size, args.workers)
     
     # Print summary statistics
     print(LOG_SEPARATOR)
@@ -632,54 +802,61 @@ def check_final_bounds_files():
     print(f"{MAGENTA}Checking for final bounds files...{RESET}")
     print(LOG_SEPARATOR)
     
-    # Walk through the blank bubbles directory
-    for root, dirs, files in os.walk(BLANK_BUBBLES_DIR):
-        # Get the spread number from the directory name
-        spread_dir = os.path.basename(root)
+    # Find every numbered blank bubble in the spread directories
+    for path, spread_num, bubble_num in _iter_blank_bubbles():
+        # Construct the filename for final bounds
+        final_bounds_filename = f"spread-{spread_num}-{bubble_num}_final.json"
+        final_bounds_path = os.path.join(FINAL_BOUNDS_DIR, final_bounds_filename)
+        
+        print(f"Checking: {get_relative_path(path)}")
         
+        # Open the final bounds file directly instead of checking it exists first
         try:
-            spread_num = int(spread_dir)
-            
-            # Process each blank bubble file
-            for file in files:
-                if file.endswith("_blank.webp") and file.startswith("spch-"):
-                    # Extract bubble number
-                    match = re.match(r"spch-(\d+)_blank\.webp", file)
-                    if match:
-                        bubble_num = int(match.group(1))
-                        
-                        # Construct the filename for final bounds
-                        final_bounds_filename = f"spread-{spread_num}-{bubble_num}_final.json"
-                        final_bounds_path = os.path.join(FINAL_BOUNDS_DIR, final_bounds_filename)
-                        
-                        blank_bubble_path = os.path.join(root, file)
-                        print(f"Checking: {get_relative_path(blank_bubble_path)}")
-                        
-                        # Check if the final bounds file exists
-                        if os.path.exists(final_bounds_path):
-                            # Check if the file has valid bubble data
-                            try:
-                                with open(final_bounds_path, 'r', encoding='utf-8') as f:
-                                    data = json.load(f)
-                                    bubbles = data.get('bubbles', [])
-                                    
-                                    if bubbles:
-                                        print(f"{GREEN}✓ Found final bounds file with {len(bubbles)} bubbles: {get_relative_path(final_bounds_path)}{RESET}")
-                                        SUCCESS_COUNT += 1
-                                    else:
-                                        print(f"{YELLOW}⚠ Final bounds file exists but contains no bubbles: {get_relative_path(final_bounds_path)}{RESET}")
-                                        WARNING_COUNT += 1
-                            except Exception as e:
-                                print(f"{RED}✗ Error reading final bounds file: {get_relative_path(final_bounds_path)}: {str(e)}{RESET}")
-                                FAILURE_COUNT += 1
-                        else:
-                            print(f"{RED}✗ Missing final bounds file: {final_bounds_filename}{RESET}")
-                            FAILURE_COUNT += 1
-                        
-                        print(LOG_SEPARATOR)
-        except ValueError:
-            # Skip directories that are not numbers
-            continue
+            with open(final_bounds_path, 'rb') as f:
+                data = json_loads(f.read())
+            bubbles = data.get('bubbles', [])
+        except FileNotFoundError:
+            print(f"{RED}✗ Missing final bounds file: {final_bounds_filename}{RESET}")
+            FAILURE_COUNT += 1
+        except Exception as e:
+            print(f"{RED}✗ Error reading final bounds file: {get_relative_path(final_bounds_path)}: {str(e)}{RESET}")
+            FAILURE_COUNT += 1
+        else:
+            # Check if the file has valid bubble data
+            if bubbles:
+                print(f"{GREEN}✓ Found final bounds file with {len(bubbles)} bubbles: {get_relative_path(final_bounds_path)}{RESET}")
+                SUCCESS_COUNT += 1
+            else:
+                print(f"{YELLOW}⚠ Final bounds file exists but contains no bubbles: {get_relative_path(final_bounds_path)}{RESET}")
+                WARNING_COUNT += 1
+        
+        print(LOG_SEPARATOR)
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_translated(spread_num, bubble_num, language, translated_dir):
+    """
+    Load and cache the translated JSON for one image.
+    
+    Args:
+        spread_num (int): Spread number
+        bubble_num (int): Bubble number
+        language (str): Language code
+        translated_dir (str): Directory containing translated JSON files
+        
+    Returns:
+        dict: Parsed JSON data or None if missing or unreadable
+    """
+    translated_file = os.path.join(translated_dir, language, f"spread-{spread_num}-{bubble_num}_final.json")
+    
+    try:
+        with open(translated_file, 'rb') as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"{RED}Error reading translated file {get_relative_path(translated_file)}: {str(e)}{RESET}")
+        return None
 
 
 def get_translated_text(spread_num, bubble_num, bubble_index, language, translated_dir):
@@ -696,40 +873,34 @@ def get_translated_text(spread_num, bubble_num, bubble_index, language, translat
     Returns:
         str: Translated text or None if not found
     """
-    # Construct the filename
-    filename = f"spread-{spread_num}-{bubble_num}_final.json"
+    # Parsed once per file and shared by every bubble in the image
+    data = _load_translated(spread_num, bubble_num, language, translated_dir)
     
-    # Path to the translated file
-    translated_file = os.path.join(translated_dir, language, filename)
-    
-    # Check if the file exists
-    if os.path.exists(translated_file):
+    if data is not None:
         try:
-            with open(translated_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Get the bubbles from the JSON
-                bubbles = data.get('bubbles', [])
-                
-                # If bubble_index is within range, use that specific bubble
-                if 0 <= bubble_index < len(bubbles):
-                    bubble_text = bubbles[bubble_index].get('text', '')
-                    if bubble_text:
-                        return bubble_text
-                    else:
-                        print(f"{RED}Error: No 'text' property found for spread-{spread_num}-{bubble_num}, bubble {bubble_index+1}{RESET}")
-                        return None
-                
-                # If no matching bubble found but there are bubbles, use the first one
-                if bubbles and bubble_index >= len(bubbles):
-                    print(f"{YELLOW}Warning: Bubble index {bubble_index} out of range for spread-{spread_num}-{bubble_num}, using first bubble{RESET}")
-                    bubble_text = bubbles[0].get('text', '')
-                    if bubble_text:
-                        return bubble_text
-                    else:
-                        print(f"{RED}Error: No 'text' property found in first bubble for spread-{spread_num}-{bubble_num}{RESET}")
-                        return None
+            # Get the bubbles from the JSON
+            bubbles = data.get('bubbles', [])
+            
+            # If bubble_index is within range, use that specific bubble
+            if 0 <= bubble_index < len(bubbles):
+                bubble_text = bubbles[bubble_index].get('text', '')
+                if bubble_text:
+                    return bubble_text
+                else:
+                    print(f"{RED}Error: No 'text' property found for spread-{spread_num}-{bubble_num}, bubble {bubble_index+1}{RESET}")
+                    return None
+            
+            # If no matching bubble found but there are bubbles, use the first one
+            if bubbles and bubble_index >= len(bubbles):
+                print(f"{YELLOW}Warning: Bubble index {bubble_index} out of range for spread-{spread_num}-{bubble_num}, using first bubble{RESET}")
+                bubble_text = bubbles[0].get('text', '')
+                if bubble_text:
+                    return bubble_text
+                else:
+                    print(f"{RED}Error: No 'text' property found in first bubble for spread-{spread_num}-{bubble_num}{RESET}")
+                    return None
         except Exception as e:
+            translated_file = os.path.join(translated_dir, language, f"spread-{spread_num}-{bubble_num}_final.json")
             print(f"{RED}Error reading translated file {get_relative_path(translated_file)}: {str(e)}{RESET}")
     
     # Fall back to the old text file method
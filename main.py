@@ -3,61 +3,101 @@ import numpy as np
 import argparse
 import os
 import json
-from PIL import Image
-from scipy import ndimage
+import re
+import functools
+import threading
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration variables
 TEXT_PADDING_X = 10  # Horizontal padding around text regions in pixels
 TEXT_PADDING_Y = 5  # Vertical padding around text regions in pixels
 
+# Worker processes for process_directory (about 70% of the cores)
+DEFAULT_WORKERS = max(1, int((os.cpu_count() or 1) * 0.7))
 
+# Bubble filenames: spch-<bubble>.webp, optionally with a _suffix before the extension
+SPCH_FILENAME_MATCH = re.compile(r"^spch-(\d+)(?:_[^.]*)?\.[^.]+$").match
+
+# WebP encoder settings for the blank bubbles
+WEBP_WRITE_PARAMS = [cv2.IMWRITE_WEBP_QUALITY, 95]
+
+# Directory holding the spread-*-*_final.json bounds files
+FINAL_BOUNDS_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/final-bounds"
+
+# Per-thread scratch buffers reused across images (each worker process has its own)
+_SCRATCH = threading.local()
+
+
+def _scratch_buffer(name, shape, dtype):
+    """
+    Return a reusable array of the given shape and dtype, sliced from a flat
+    buffer that only grows to the largest image seen. Contents are undefined.
+    
+    Args:
+        name (str): Buffer name, one per distinct use
+        shape (tuple): Shape of the array to return
+        dtype (dtype): Data type of the array
+        
+    Returns:
+        ndarray: C-contiguous view into the scratch buffer
+    """
+    size = int(np.prod(shape))
+    buf = getattr(_SCRATCH, name, None)
+    if buf is None or buf.dtype != dtype or buf.size < size:
+        buf = np.empty(size, dtype=dtype)
+        setattr(_SCRATCH, name, buf)
+    return buf[:size].reshape(shape)
+
+
+@functools.lru_cache(maxsize=1024)
 def get_text_regions_from_json(spread_num, bubble_num):
     """
     Get text regions from the JSON file in the final-final-final directory.
+    Results are cached, so the returned array is read-only.
     
     Args:
         spread_num (int): Spread number
         bubble_num (int): Bubble number
         
     Returns:
-        list: List of text region dictionaries or None if not found
+        ndarray: (N, 4) int32 array of x, y, width, height rows or None if not found
     """
     # Construct the filename
     filename = f"spread-{spread_num}-{bubble_num}_final.json"
     
     # Path to the final bounds file
-    bounds_file = os.path.join(
-        "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/final-bounds", 
-        filename
-    )
+    bounds_file = os.path.join(FINAL_BOUNDS_DIR, filename)
     
     # Check if the file exists
     if os.path.exists(bounds_file):
         with open(bounds_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
             
-            # Extract text regions from all bubbles
+            # Extract text regions from all bubbles as (x, y, width, height) rows
             all_regions = []
             if 'bubbles' in data:
                 for bubble in data['bubbles']:
                     if 'text_regions' in bubble:
-                        all_regions.extend(bubble['text_regions'])
+                        all_regions.extend(
+                            (region['x'], region['y'], region['width'], region['height'])
+                            for region in bubble['text_regions']
+                        )
                     # If no text_regions in bubble, use the bubble bounds itself
                     elif 'x' in bubble and 'y' in bubble and 'width' in bubble and 'height' in bubble:
-                        all_regions.append({
-                            'x': bubble['x'],
-                            'y': bubble['y'],
-                            'width': bubble['width'],
-                            'height': bubble['height']
-                        })
-            return all_regions
+                        all_regions.append(
+                            (bubble['x'], bubble['y'], bubble['width'], bubble['height'])
+                        )
+            
+            regions = np.array(all_regions, dtype=np.int32).reshape(-1, 4)
+            regions.flags.writeable = False
+            return regions
     
     return None
 
 
 def remove_text_from_speech_bubble(
-    image_path, output_path=None, border_thickness=5, softness=1
+    image_path, output_path=None, border_thickness=5, softness=1, inpaint=False
 ):
     """
     Removes text from a speech bubble image while preserving the bubble structure
@@ -69,6 +109,8 @@ def remove_text_from_speech_bubble(
                                     will use input_name_blank.webp
         border_thickness (int): Thickness of the border in pixels
         softness (int): Amount of blur to apply to the border (0 for sharp)
+        inpaint (bool): Reconstruct the text regions from the surrounding pixels
+                        (Telea inpainting) instead of filling them with white
 
     Returns:
         str: Path to the saved blank speech bubble image
@@ -78,30 +120,24 @@ def remove_text_from_speech_bubble(
         name_parts = image_path.rsplit(".", 1)
         output_path = f"{name_parts[0]}_blank.webp"
 
-    # Open the image with PIL to preserve transparency
-    pil_img = Image.open(image_path)
-    
-    # Convert to numpy array for processing
-    img = np.array(pil_img)
+    # Read straight into a numpy array, keeping the alpha channel (BGRA order;
+    # every fill below is grey/white, so the channel order doesn't matter)
+    img = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        print(f"Error: Could not read image {image_path}")
+        return None
     
     # Check if image has an alpha channel
-    if img.shape[2] == 4:
+    if img.ndim == 3 and img.shape[2] == 4:
         # Try to extract spread and bubble numbers from the filename
         filename = os.path.basename(image_path)
         match = None
         
-        # Try different filename patterns
-        if filename.startswith("spch-"):
+        # Extract just the number part between "spch-" and either "_" or "."
+        filename_match = SPCH_FILENAME_MATCH(filename)
+        if filename_match:
             spread_num = os.path.basename(os.path.dirname(image_path))
-            # Extract just the number part between "spch-" and either "_" or "."
-            bubble_part = filename.split("-")[1]
-            if "_" in bubble_part:
-                bubble_num = bubble_part.split("_")[0]
-            else:
-                # If no underscore, remove any file extension
-                bubble_num = bubble_part.split(".")[0]
-            
-            match = (spread_num, bubble_num)
+            match = (spread_num, filename_match.group(1))
         
         if match:
             spread_num, bubble_num = match
@@ -112,42 +148,53 @@ def remove_text_from_speech_bubble(
                 # Get text regions from JSON
                 text_regions = get_text_regions_from_json(spread_num, bubble_num)
                 
-                if text_regions:
+                if text_regions is not None and len(text_regions):
                     # Create a copy of the image
-                    result = img.copy()
+                    result = _scratch_buffer("result", img.shape, img.dtype)
+                    np.copyto(result, img)
+                    
+                    # Pad and clip every region at once: columns are x, y, width, height.
+                    # The padded size is measured from the clipped start, as before
+                    xs, ys, widths, heights = text_regions.T
+                    img_height, img_width = img.shape[:2]
+                    x0 = np.clip(xs - TEXT_PADDING_X, 0, img_width)
+                    y0 = np.clip(ys - TEXT_PADDING_Y, 0, img_height)
+                    x1 = np.clip(x0 + widths + 2 * TEXT_PADDING_X, 0, img_width)
+                    y1 = np.clip(y0 + heights + 2 * TEXT_PADDING_Y, 0, img_height)
+                    
+                    # Rasterize every text region into one mask
+                    text_mask = _scratch_buffer("text_mask", img.shape[:2], np.bool_)
+                    text_mask.fill(False)
+                    for left, top, right, bottom in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()):
+                        text_mask[top:bottom, left:right] = True
                     
-                    # For each text region, fill with white
-                    for region in text_regions:
-                        x, y = region['x'], region['y']
-                        width, height = region['width'], region['height']
-                        
-                        # Add some padding around the text region
-                        padding_x = TEXT_PADDING_X
-                        padding_y = TEXT_PADDING_Y
-                        x = max(0, x - padding_x)
-                        y = max(0, y - padding_y)
-                        width = min(img.shape[1] - x, width + 2 * padding_x)
-                        height = min(img.shape[0] - y, height + 2 * padding_y)
-                        
-                        # Fill the region with white
-                        result[y:y+height, x:x+width, :3] = [255, 255, 255]  # White RGB
-                        
-                        # We'll remove the border drawing code for text regions
-                        # as it's creating unwanted black borders
+                    if inpaint:
+                        # Content-aware fill for bubbles with a textured or tinted interior
+                        text_mask_u8 = text_mask.astype(np.uint8) * 255
+                        result[:, :, :3] = cv2.inpaint(
+                            np.ascontiguousarray(img[:, :, :3]), text_mask_u8, 3, cv2.INPAINT_TELEA
+                        )
+                    else:
+                        # Fill all the regions with white in a single store
+                        result[text_mask, :3] = 255  # White RGB
+                    
+                    # We'll remove the border drawing code for text regions
+                    # as it's creating unwanted black borders
                     
-                    # Convert back to PIL and save
-                    result_pil = Image.fromarray(result)
-                    result_pil.save(output_path)
+                    # Save the result
+                    if not cv2.imwrite(output_path, result, WEBP_WRITE_PARAMS):
+                        print(f"Error: Could not write {output_path}")
+                        return None
                     
-                    print(f"Processed image saved to {output_path} (using text regions)")
+                    method = "inpainted text regions" if inpaint else "text regions"
+                    print(f"Processed image saved to {output_path} (using {method})")
                     return output_path
             except (ValueError, TypeError) as e:
                 print(f"Could not parse spread/bubble numbers from path: {e}")
                 # Fall back to the original method
         
         # If we couldn't use text regions, fall back to the original method
-        # Split the image into color channels and alpha
-        rgb = img[:, :, :3]
+        # Take the alpha channel
         alpha = img[:, :, 3]
         
         # Convert the alpha channel to binary (transparent vs non-transparent)
@@ -158,51 +205,67 @@ def remove_text_from_speech_bubble(
             binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
         
-        # Create a mask for the entire bubble interior
-        bubble_mask = np.zeros_like(binary)
+        # Create a mask for the entire bubble interior, reusing the threshold buffer
+        # (findContours no longer needs it and doesn't modify its input)
+        bubble_mask = binary
+        bubble_mask.fill(0)
         
-        # Find the largest contour (assumes the speech bubble is the largest object)
+        # Find the largest contour (assumes the speech bubble is the largest object).
+        # Every input holds a single bubble, so smaller contours are stray specks and
+        # are deliberately not filled
         if contours:
-            largest_contour = max(contours, key=cv2.contourArea)
+            largest_index = max(range(len(contours)), key=lambda i: cv2.contourArea(contours[i]))
             cv2.drawContours(
-                bubble_mask, [largest_contour], 0, 255, -1
+                bubble_mask, contours, largest_index, 255, -1
             )  # Fill the contour
         
-        # Create a mask for the border by finding the difference between the filled contour
-        # and an eroded version of it with the specified border thickness
-        kernel = np.ones((3, 3), np.uint8)
-        eroded = cv2.erode(bubble_mask, kernel, iterations=border_thickness)
-        border_mask = bubble_mask - eroded
+        # Create a mask for the border: the morphological gradient with a square kernel
+        # of the border thickness (same as eroding 3x3 that many times), kept to the
+        # pixels inside the filled contour
+        kernel_size = 2 * border_thickness + 1
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+        border_mask = cv2.morphologyEx(bubble_mask, cv2.MORPH_GRADIENT, kernel)
+        cv2.bitwise_and(border_mask, bubble_mask, dst=border_mask)
         
         # Apply gaussian blur to soften the border if requested
         if softness > 0:
-            border_mask_float = border_mask.astype(float) / 255.0
-            border_mask_float = ndimage.gaussian_filter(
-                border_mask_float, sigma=softness
+            # Same kernel radius (4 sigma) and edge reflection as ndimage.gaussian_filter.
+            # Blurring in float keeps the truncation back to uint8, so the faint outer
+            # edge of the border does not grow by a rounded-up pixel
+            # float32 (not float64) and scaled in place, so the pass allocates a single
+            # float buffer
+            ksize = 2 * int(4 * softness + 0.5) + 1
+            border_mask_float = border_mask.astype(np.float32)
+            border_mask_float /= 255.0
+            cv2.GaussianBlur(
+                border_mask_float, (ksize, ksize), softness,
+                dst=border_mask_float, borderType=cv2.BORDER_REFLECT
             )
-            border_mask = (border_mask_float * 255).astype(np.uint8)
+            border_mask_float *= 255
+            border_mask = border_mask_float.astype(np.uint8)
         
         # Create the result image
-        result = np.zeros_like(img)
+        result = _scratch_buffer("result", img.shape, img.dtype)
+        result.fill(0)
         
-        # First fill the entire bubble with white
-        result[bubble_mask > 0, :3] = [255, 255, 255]  # White RGB
-        result[bubble_mask > 0, 3] = 255  # Fully opaque
+        # First fill the entire bubble with white and fully opaque; every channel
+        # is 255, so one store through a single boolean mask covers them all
+        inside = bubble_mask > 0
+        result[inside] = 255
         
         # Then blend in the border based on border mask intensity
         # This creates a softer transition for the border
-        for y in range(img.shape[0]):
-            for x in range(img.shape[1]):
-                if border_mask[y, x] > 0:
-                    # Calculate opacity based on border mask intensity
-                    opacity = border_mask[y, x] / 255.0
-                    # Blend between white and black based on opacity
-                    result[y, x, 0:3] = [int(255 * (1 - opacity))] * 3  # Blend to black
-                    result[y, x, 3] = 255  # Keep fully opaque
+        border = border_mask > 0
+        # Blend between white and black based on opacity, for all border pixels at once
+        opacity = border_mask[border] / 255.0
+        blended = (255 * (1 - opacity)).astype(np.uint8)
+        result[border, :3] = blended[:, None]  # Blend to black
+        result[border, 3] = 255  # Keep fully opaque
         
-        # Convert back to PIL and save
-        result_pil = Image.fromarray(result)
-        result_pil.save(output_path)
+        # Save the result
+        if not cv2.imwrite(output_path, result, WEBP_WRITE_PARAMS):
+            print(f"Error: Could not write {output_path}")
+            return None
         
         print(f"Processed image saved to {output_path} (using fallback method)")
         return output_path
@@ -211,7 +274,83 @@ def remove_text_from_speech_bubble(
         return None
 
 
-def process_directory(input_dir, output_dir=None, border_thickness=4, softness=0.6, overwrite=False):
+def _iter_jobs(input_dir, output_dir, overwrite, skipped):
+    """
+    Walk input_dir and yield an (input_file, output_file) job for every speech
+    bubble image that still needs a blank version.
+
+    Args:
+        input_dir (str): Directory containing the speech bubble images
+        output_dir (str): Directory the blank bubbles are written to
+        overwrite (bool): Whether to yield jobs whose output already exists
+        skipped (list): Receives the input files skipped because their output exists
+
+    Yields:
+        tuple: (input_file, output_file)
+    """
+    # Snapshot the existing output tree once, so each file below is a set lookup
+    # instead of a stat
+    existing = set()
+    for out_root, out_dirs, out_files in os.walk(output_dir):
+        existing.add(out_root)
+        for out_filename in out_files:
+            existing.add(os.path.join(out_root, out_filename))
+
+    # Recursively walk through the directory
+    for root, dirs, files in os.walk(input_dir):
+        for filename in files:
+            # Process only webp files that match the pattern spch-*
+            if filename.endswith(".webp") and filename.startswith("spch-") and not filename.endswith("_blank.webp"):
+                input_file = os.path.join(root, filename)
+
+                # Get the spread number from the directory name
+                spread_dir = os.path.basename(root)
+                
+                # Create corresponding output directory
+                spread_output_dir = os.path.join(output_dir, spread_dir)
+                if spread_output_dir not in existing:
+                    os.makedirs(spread_output_dir, exist_ok=True)
+                    existing.add(spread_output_dir)
+                
+                # Determine output path
+                output_file = os.path.join(
+                    spread_output_dir, filename.replace(".webp", "_blank.webp")
+                )
+
+                # Skip if the output file already exists and overwrite is False
+                if not overwrite and output_file in existing:
+                    print(f"Skipping {input_file} (output already exists at {output_file})")
+                    skipped.append(input_file)
+                    continue
+
+                yield input_file, output_file
+
+
+def _process_job(job, border_thickness, softness, inpaint):
+    """
+    Worker entry point: run remove_text_from_speech_bubble for one job and
+    return the outcome instead of raising, so one bad file doesn't stop the map.
+
+    Args:
+        job (tuple): (input_file, output_file)
+        border_thickness (int): Thickness of the border in pixels
+        softness (float): Amount of blur to apply to the border
+        inpaint (bool): Inpaint text regions instead of filling them with white
+
+    Returns:
+        tuple: (input_file, result, error) where error is None on success
+    """
+    input_file, output_file = job
+    try:
+        result = remove_text_from_speech_bubble(
+            input_file, output_file, border_thickness, softness, inpaint
+        )
+        return input_file, result, None
+    except Exception as e:
+        return input_file, None, e
+
+
+def process_directory(input_dir, output_dir=None, border_thickness=4, softness=0.6, overwrite=False, inpaint=False, workers=None):
     """
     Process all spch-*.webp files in a directory to remove text from speech bubbles.
 
@@ -222,6 +361,8 @@ def process_directory(input_dir, output_dir=None, border_thickness=4, softness=0
         border_thickness (int): Thickness of the border in pixels
         softness (float): Amount of blur to apply to the border
         overwrite (bool): Whether to overwrite existing blank bubble files
+        inpaint (bool): Inpaint text regions instead of filling them with white
+        workers (int): Number of worker processes (defaults to DEFAULT_WORKERS)
     """
     # Set default output directory if not specified
     if output_dir is None:
@@ -238,47 +379,27 @@ def process_directory(input_dir, output_dir=None, border_thickness=4, softness=0
 
     # Counters for statistics
     files_processed = 0
-    files_skipped = 0
     errors = 0
 
-    # Recursively walk through the directory
-    for root, dirs, files in os.walk(input_dir):
-        for filename in files:
-            # Process only webp files that match the pattern spch-*
-            if filename.endswith(".webp") and filename.startswith("spch-") and not filename.endswith("_blank.webp"):
-                input_file = os.path.join(root, filename)
+    # Inputs whose output already exists; filled in by the job generator
+    skipped = []
 
-                # Get the spread number from the directory name
-                spread_dir = os.path.basename(root)
-                
-                # Create corresponding output directory
-                spread_output_dir = os.path.join(output_dir, spread_dir)
-                if not os.path.exists(spread_output_dir):
-                    os.makedirs(spread_output_dir)
-                
-                # Determine output path
-                output_file = os.path.join(
-                    spread_output_dir, filename.replace(".webp", "_blank.webp")
-                )
-
-                # Skip if the output file already exists and overwrite is False
-                if os.path.exists(output_file) and not overwrite:
-                    print(f"Skipping {input_file} (output already exists at {output_file})")
-                    files_skipped += 1
-                    continue
-
-                # Process the image
-                try:
-                    result = remove_text_from_speech_bubble(
-                        input_file, output_file, border_thickness, softness
-                    )
-                    if result:
-                        files_processed += 1
-                    else:
-                        errors += 1
-                except Exception as e:
-                    print(f"Error processing {input_file}: {e}")
-                    errors += 1
+    # Each image is independent, so process them in parallel worker processes.
+    # Jobs are generated lazily, so workers start while the walk is still running
+    worker = functools.partial(
+        _process_job, border_thickness=border_thickness, softness=softness, inpaint=inpaint
+    )
+    with ProcessPoolExecutor(max_workers=workers or DEFAULT_WORKERS) as executor:
+        jobs = _iter_jobs(input_dir, output_dir, overwrite, skipped)
+        for input_file, result, error in executor.map(worker, jobs, chunksize=8):
+            if error is not None:
+                print(f"Error processing {input_file}: {error}")
+                errors += 1
+            elif result:
+                files_processed += 1
+            else:
+                errors += 1
+    files_skipped = len(skipped)
 
     # Print summary
     print(f"\nProcessing complete:")
@@ -325,17 +446,30 @@ def main():
         action="store_true",
         help="Overwrite existing blank bubble files",
     )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of worker processes for a directory (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--inpaint",
+        "-i",
+        action="store_true",
+        help="Inpaint text regions from the surrounding pixels instead of filling them with white",
+    )
 
     args = parser.parse_args()
 
     # Check if the input path is a directory or a file
     if os.path.isdir(args.input_path):
         # Process the entire directory
-        process_directory(args.input_path, args.output, args.thickness, args.softness, args.overwrite)
+        process_directory(args.input_path, args.output, args.thickness, args.softness, args.overwrite, args.inpaint, args.workers)
     else:
         # Process a single file
         remove_text_from_speech_bubble(
-            args.input_path, args.output, args.thickness, args.softness
+            args.input_path, args.output, args.thickness, args.softness, args.inpaint
         )
 
 
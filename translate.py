@@ -34,9 +34,9 @@ def main():
         return
 
     # Collect all JSON files and their bubble texts
-    files_to_translate = []
+    files_to_translate = []  # One (input_file, output_file, data) entry per file
     texts_to_translate = []
-    bubble_indices = []  # To keep track of which bubble each text belongs to
+    text_owners = []  # (file index, bubble index) each text belongs to
 
     for filename in os.listdir(INPUT_DIR):
         if filename.endswith("_final.json"):
@@ -54,13 +54,18 @@ def main():
                     data = json.load(file)
                 
                 # Extract text from each bubble
+                file_idx = None
                 if 'bubbles' in data and data['bubbles']:
                     for i, bubble in enumerate(data['bubbles']):
                         if 'text' in bubble and bubble['text']:
-                            # Add the file, bubble index, and its text to the lists
-                            files_to_translate.append((input_file, output_file, data))
+                            # Register the file once, on its first text
+                            if file_idx is None:
+                                files_to_translate.append((input_file, output_file, data))
+                                file_idx = len(files_to_translate) - 1
+                            
+                            # Add the text and where it belongs to the lists
                             texts_to_translate.append(bubble['text'])
-                            bubble_indices.append(i)
+                            text_owners.append((file_idx, i))
             except Exception as e:
                 print(f"Error reading {input_file}: {e}")
 
@@ -77,28 +82,23 @@ def main():
         )
 
         # Group translations by file
-        file_translations = {}
-        for (input_file, output_file, data), translated_text, bubble_idx in zip(
-            files_to_translate, translated_results, bubble_indices
-        ):
-            if output_file not in file_translations:
-                file_translations[output_file] = (data, [])
-            
+        file_translations = [[] for _ in files_to_translate]
+        for (file_idx, bubble_idx), translated_text in zip(text_owners, translated_results):
             # Store the translation with its bubble index
-            file_translations[output_file][1].append((bubble_idx, translated_text.text))
+            file_translations[file_idx].append((bubble_idx, translated_text.text))
         
         # Write the translated results to the output files
-        for output_file, (data, translations) in file_translations.items():
-            # Create a deep copy of the data to avoid modifying the original
-            translated_data = json.loads(json.dumps(data))
-            
-            # Update each bubble with its translation
+        for (input_file, output_file, data), translations in zip(
+            files_to_translate, file_translations
+        ):
+            # Each file's data was parsed just for this run and isn't reused,
+            # so update each bubble with its translation in place
             for bubble_idx, translated_text in translations:
-                translated_data['bubbles'][bubble_idx]['text'] = translated_text
+                data['bubbles'][bubble_idx]['text'] = translated_text
             
             # Write the updated JSON to the output file
             with open(output_file, "w", encoding="utf-8") as file:
-                json.dump(translated_data, file, indent=4, ensure_ascii=False)
+                json.dump(data, file, indent=4, ensure_ascii=False)
             
             print(f"Translated and saved to {output_file}")
 
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 import os
+import sys
 import json
 import cv2
 import numpy as np
 from pathlib import Path
 import math
+import heapq
+import hashlib
 import argparse
-from sklearn.cluster import DBSCAN
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from scipy.sparse.csgraph import connected_components
+from sklearn.neighbors import radius_neighbors_graph
+
+try:
+    # Faster parser for the bounds files; the stdlib json.loads accepts the
+    # same bytes input when orjson is not installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Directory containing the JSON files with bounding box data
 BOUNDS_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/bounds/initial-bounds"
@@ -14,11 +27,22 @@ BOUNDS_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/med
 OUTPUT_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/visualized"
 # Directory to save the final processed bounds
 FINAL_BOUNDS_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/bounds/final-bounds"
+# Directory to cache clustering labels in (safe to delete)
+CLUSTER_CACHE_DIR = "/Users/robertsbrinkis/Documents/GitHub/speech-bubble-translate/media/bounds/cluster-cache"
 # Configuration variables
 MAX_BUBBLES = 2
 CLUSTERING_EPS = 225
 VERTICAL_WEIGHT = 1.5
 HORIZONTAL_PENALTY = 0.75
+# Region counts below this use a brute-force distance matrix instead of a radius neighbors graph
+BRUTE_FORCE_MAX_REGIONS = 30
+# JPEG encoder settings for the debug visualizations
+JPEG_WRITE_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80]
+
+# Outcomes reported by visualize_speech_bubbles
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
 
 # ANSI color codes for better logging
 RED = "\033[91m"
@@ -33,20 +57,48 @@ def ensure_directory_exists(directory):
 
 def get_json_files(directory):
     """Get all JSON files from the specified directory."""
-    json_files = []
+    # scandir entries carry the name, full path and file type from a single directory read
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith("_bounds.json") and entry.is_file()]
+
+def get_region_boxes(regions):
+    """
+    Build the bounding boxes of all text regions as one array.
     
-    for file in os.listdir(directory):
-        if file.endswith("_bounds.json"):
-            json_files.append(os.path.join(directory, file))
+    Args:
+        regions: List of text region dictionaries
+        
+    Returns:
+        (N, 4) int64 array of [min_x, min_y, max_x, max_y] rows, one per region
+    """
+    boxes = np.fromiter(
+        (v for region in regions
+         for v in (region['x'], region['y'], region['width'], region['height'])),
+        dtype=np.int64, count=4 * len(regions)).reshape(-1, 4)
+    boxes[:, 2:] += boxes[:, :2]
+    return boxes
+
+def get_bubble_box(boxes, indices):
+    """
+    Get the bounding box that contains a group of text regions.
     
-    return json_files
+    Args:
+        boxes: (N, 4) array of region boxes from get_region_boxes
+        indices: Indices of the regions belonging to the bubble
+        
+    Returns:
+        Tuple of (min_x, min_y, max_x, max_y)
+    """
+    group = boxes[indices]
+    return (*group[:, :2].min(axis=0).tolist(), *group[:, 2:].max(axis=0).tolist())
 
-def group_text_regions_by_distance(regions, eps=225, vertical_weight=1.5, horizontal_penalty=0.5):
+def group_text_regions_by_distance(boxes, eps=225, vertical_weight=1.5, horizontal_penalty=0.5):
     """
     Group text regions into separate bubbles based on distance.
     
     Args:
-        regions: List of text region dictionaries
+        boxes: (N, 4) array of region boxes from get_region_boxes
         eps: Maximum distance between two points to be considered in the same cluster
         vertical_weight: Weight factor for vertical distances (higher values make vertical
                          distances more significant than horizontal distances)
@@ -54,39 +106,95 @@ def group_text_regions_by_distance(regions, eps=225, vertical_weight=1.5, horizo
                            horizontal distances less significant)
         
     Returns:
-        List of lists, where each inner list contains text regions for one bubble
+        List of lists, where each inner list contains the region indices for one bubble
     """
-    if not regions:
+    if not len(boxes):
         return []
     
-    # Extract center points of each text region
-    points = []
-    for region in regions:
-        x = region['x'] + region['width'] // 2
-        y = region['y'] + region['height'] // 2
-        # Scale y-coordinates by the vertical weight to make vertical distances more significant
-        # Scale x-coordinates by the horizontal penalty to make horizontal distances less significant
-        points.append([x * horizontal_penalty, y * vertical_weight])
-    
-    # Use DBSCAN clustering to group nearby text regions
-    clustering = DBSCAN(eps=eps, min_samples=1).fit(points)
-    labels = clustering.labels_
-    
-    # Group regions by cluster label
-    grouped_regions = {}
-    for i, label in enumerate(labels):
-        if label not in grouped_regions:
-            grouped_regions[label] = []
-        grouped_regions[label].append(regions[i])
-    
-    return list(grouped_regions.values())
+    # Center points of each text region
+    centers = boxes[:, :2] + (boxes[:, 2:] - boxes[:, :2]) // 2
+    
+    # Graph linking every pair of regions within eps (brute force is cheaper for small pages).
+    # Vertical distances are scaled by vertical_weight and horizontal ones by horizontal_penalty
+    if len(boxes) < BRUTE_FORCE_MAX_REGIONS:
+        # Weighted squared distance straight from the integer center offsets
+        dx = centers[:, None, 0] - centers[None, :, 0]
+        dy = centers[:, None, 1] - centers[None, :, 1]
+        within_eps = (horizontal_penalty ** 2 * (dx * dx) +
+                      vertical_weight ** 2 * (dy * dy)) <= eps * eps
+    else:
+        # The tree search needs the scaled points themselves
+        points = centers * np.array([horizontal_penalty, vertical_weight])
+        within_eps = radius_neighbors_graph(points, eps, mode='connectivity', include_self=True)
+    
+    # Connected components of that graph are the clusters DBSCAN with min_samples=1 finds
+    _, labels = connected_components(within_eps, directed=False)
+    
+    return groups_from_labels(labels)
+
+def groups_from_labels(labels):
+    """
+    Turn per-region cluster labels into lists of region indices.
+    
+    Args:
+        labels: Cluster label of every region, numbered 0..K-1 in order of each
+                group's first region (as connected_components assigns them)
+        
+    Returns:
+        List of lists of region indices, in order of each group's first region
+    """
+    # Bucket sort: a stable argsort lists regions by label, keeping their order within a group
+    order = np.argsort(labels, kind='stable').tolist()
+    ends = np.cumsum(np.bincount(labels)).tolist()
+    
+    # Slice each group out of the sorted indices
+    return [order[start:end] for start, end in zip([0] + ends[:-1], ends)]
 
-def merge_overlapping_bubbles(bubble_groups):
+def group_text_regions_cached(boxes, json_path, eps=225, vertical_weight=1.5, horizontal_penalty=0.5):
+    """
+    Group text regions like group_text_regions_by_distance, reusing the labels
+    from an earlier run when the regions and clustering settings are unchanged.
+    
+    Args:
+        boxes: (N, 4) array of region boxes from get_region_boxes
+        json_path: Path to the JSON file the regions came from
+        eps, vertical_weight, horizontal_penalty: See group_text_regions_by_distance
+        
+    Returns:
+        List of lists, where each inner list contains the region indices for one bubble
+    """
+    # Cache key covers the region boxes and every clustering setting
+    key_data = boxes.tobytes() + repr((eps, vertical_weight, horizontal_penalty)).encode()
+    key = hashlib.blake2b(key_data, digest_size=16).hexdigest()
+    cache_path = os.path.join(CLUSTER_CACHE_DIR, f"{os.path.basename(json_path)}.{key}.npy")
+    
+    # Reuse cached labels if present and intact
+    try:
+        labels = np.load(cache_path)
+        if len(labels) == len(boxes):
+            return groups_from_labels(labels)
+    except (OSError, ValueError):
+        pass
+    
+    # Cluster from scratch and store the group number of every region
+    bubble_groups = group_text_regions_by_distance(boxes, eps, vertical_weight, horizontal_penalty)
+    labels = np.empty(len(boxes), dtype=np.int32)
+    for label, bubble in enumerate(bubble_groups):
+        labels[bubble] = label
+    try:
+        np.save(cache_path, labels)
+    except OSError:
+        pass
+    
+    return bubble_groups
+
+def merge_overlapping_bubbles(bubble_groups, boxes):
     """
     Merge bubble groups that have overlapping bounding boxes.
     
     Args:
-        bubble_groups: List of lists, where each inner list contains text regions for one bubble
+        bubble_groups: List of lists, where each inner list contains the region indices for one bubble
+        boxes: (N, 4) array of region boxes from get_region_boxes
         
     Returns:
         List of lists with overlapping bubbles merged
@@ -95,59 +203,48 @@ def merge_overlapping_bubbles(bubble_groups):
         return bubble_groups
     
     # Calculate bounding boxes for each bubble group
-    bubble_boxes = []
-    for bubble in bubble_groups:
-        min_x = min(region['x'] for region in bubble)
-        min_y = min(region['y'] for region in bubble)
-        max_x = max(region['x'] + region['width'] for region in bubble)
-        max_y = max(region['y'] + region['height'] for region in bubble)
-        bubble_boxes.append((min_x, min_y, max_x, max_y))
-    
-    # Check for overlaps and merge until no more overlaps exist
-    merged = True
-    while merged:
-        merged = False
-        i = 0
-        while i < len(bubble_groups):
-            j = i + 1
-            while j < len(bubble_groups):
-                # Check if bubbles i and j overlap
-                box_i = bubble_boxes[i]
-                box_j = bubble_boxes[j]
-                
-                # Check for overlap
-                if (box_i[0] < box_j[2] and box_i[2] > box_j[0] and
-                    box_i[1] < box_j[3] and box_i[3] > box_j[1]):
-                    # Merge bubble j into bubble i
-                    bubble_groups[i].extend(bubble_groups[j])
-                    
-                    # Update bounding box for the merged bubble
-                    min_x = min(box_i[0], box_j[0])
-                    min_y = min(box_i[1], box_j[1])
-                    max_x = max(box_i[2], box_j[2])
-                    max_y = max(box_i[3], box_j[3])
-                    bubble_boxes[i] = (min_x, min_y, max_x, max_y)
-                    
-                    # Remove bubble j
-                    bubble_groups.pop(j)
-                    bubble_boxes.pop(j)
-                    
-                    merged = True
-                else:
-                    j += 1
-            
-            if merged:
-                break
-            i += 1
+    bubble_boxes = np.array([get_bubble_box(boxes, bubble) for bubble in bubble_groups])
     
-    return bubble_groups
+    # Merged bubble each original group currently belongs to
+    group_labels = np.arange(len(bubble_groups))
+    
+    # Merge connected overlapping bubbles, repeating while merged boxes reach further bubbles
+    while True:
+        # Pairwise overlap matrix of all bubble boxes
+        x0, y0, x1, y1 = bubble_boxes.T
+        overlaps = ((x0[:, None] < x1[None, :]) & (x1[:, None] > x0[None, :]) &
+                    (y0[:, None] < y1[None, :]) & (y1[:, None] > y0[None, :]))
+        
+        # Each connected component of overlapping boxes becomes one bubble
+        n_components, labels = connected_components(overlaps, directed=False)
+        if n_components == len(bubble_boxes):
+            break
+        group_labels = labels[group_labels]
+        
+        # Bounding box of each merged bubble from the boxes it absorbed
+        merged_boxes = np.empty((n_components, 4), dtype=bubble_boxes.dtype)
+        merged_boxes[:, :2] = np.iinfo(bubble_boxes.dtype).max
+        merged_boxes[:, 2:] = np.iinfo(bubble_boxes.dtype).min
+        np.minimum.at(merged_boxes[:, :2], labels, bubble_boxes[:, :2])
+        np.maximum.at(merged_boxes[:, 2:], labels, bubble_boxes[:, 2:])
+        bubble_boxes = merged_boxes
+    
+    # Rebuild the region lists once, in order of each bubble's first group
+    if len(bubble_boxes) == len(bubble_groups):
+        return bubble_groups
+    merged_groups = {}
+    for bubble, label in zip(bubble_groups, group_labels.tolist()):
+        merged_groups.setdefault(label, []).extend(bubble)
+    
+    return list(merged_groups.values())
 
-def filter_and_prioritize_bubbles(bubble_groups, max_bubbles=MAX_BUBBLES):
+def filter_and_prioritize_bubbles(bubble_groups, boxes, max_bubbles=MAX_BUBBLES):
     """
     Filter bubble groups to keep only the largest ones, up to max_bubbles.
     
     Args:
-        bubble_groups: List of lists, where each inner list contains text regions for one bubble
+        bubble_groups: List of lists, where each inner list contains the region indices for one bubble
+        boxes: (N, 4) array of region boxes from get_region_boxes
         max_bubbles: Maximum number of bubbles to keep
         
     Returns:
@@ -157,27 +254,25 @@ def filter_and_prioritize_bubbles(bubble_groups, max_bubbles=MAX_BUBBLES):
         return bubble_groups
     
     # Calculate area for each bubble group
-    bubble_areas = []
-    for bubble in bubble_groups:
-        min_x = min(region['x'] for region in bubble)
-        min_y = min(region['y'] for region in bubble)
-        max_x = max(region['x'] + region['width'] for region in bubble)
-        max_y = max(region['y'] + region['height'] for region in bubble)
-        area = (max_x - min_x) * (max_y - min_y)
-        bubble_areas.append((area, bubble))
-    
-    # Sort bubbles by area in descending order and keep only the largest ones
-    bubble_areas.sort(reverse=True)
-    return [bubble for _, bubble in bubble_areas[:max_bubbles]]
+    bubble_boxes = np.array([get_bubble_box(boxes, bubble) for bubble in bubble_groups])
+    bubble_areas = ((bubble_boxes[:, 2] - bubble_boxes[:, 0]) *
+                    (bubble_boxes[:, 3] - bubble_boxes[:, 1])).tolist()
+    
+    # Keep only the largest bubbles, in descending order of area, without sorting them all
+    largest = heapq.nlargest(max_bubbles, range(len(bubble_groups)), key=bubble_areas.__getitem__)
+    return [bubble_groups[i] for i in largest]
 
-def save_final_bounds(data, bubble_groups, json_path, overwrite=False):
+def save_final_bounds(data, bubble_groups, bubble_boxes, bubble_texts, json_path, messages, overwrite=False):
     """
     Save the final processed bounds as a new JSON file.
     
     Args:
         data: Original JSON data
-        bubble_groups: Processed bubble groups
+        bubble_groups: Processed bubble groups (lists of text region dictionaries)
+        bubble_boxes: (min_x, min_y, max_x, max_y) bounding box of each bubble group
+        bubble_texts: Combined text of each bubble group
         json_path: Path to the original JSON file
+        messages: List that log lines for this file are appended to
         overwrite: Whether to overwrite existing files
     
     Returns:
@@ -193,16 +288,8 @@ def save_final_bounds(data, bubble_groups, json_path, overwrite=False):
     }
     
     # Add each bubble group
-    for i, bubble in enumerate(bubble_groups):
-        # Find the bounding box that contains all text regions in this bubble
-        min_x = min(region['x'] for region in bubble)
-        min_y = min(region['y'] for region in bubble)
-        max_x = max(region['x'] + region['width'] for region in bubble)
-        max_y = max(region['y'] + region['height'] for region in bubble)
-        
-        # Combine all text in this bubble
-        full_text = " ".join(region['text'] for region in bubble)
-        
+    for i, (bubble, (min_x, min_y, max_x, max_y), full_text) in enumerate(
+            zip(bubble_groups, bubble_boxes, bubble_texts)):
         # Add bubble data
         final_data['bubbles'].append({
             'bubble_number': i + 1,
@@ -220,73 +307,91 @@ def save_final_bounds(data, bubble_groups, json_path, overwrite=False):
     
     # Check if file exists and we're not overwriting
     if os.path.exists(output_path) and not overwrite:
-        print(f"{YELLOW}Skipping: Final bounds file already exists at {output_path}{RESET}")
-        print(f"{YELLOW}Use -o/--overwrite to overwrite existing files{RESET}")
+        messages.append(f"{YELLOW}Skipping: Final bounds file already exists at {output_path}{RESET}")
+        messages.append(f"{YELLOW}Use -o/--overwrite to overwrite existing files{RESET}")
         return None
     
-    # Save the final bounds
+    # Save the final bounds (json.dumps runs the C encoder, json.dump the pure-Python one)
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(final_data, f, indent=4, ensure_ascii=False)
+        f.write(json.dumps(final_data, indent=4, ensure_ascii=False))
     
-    print(f"{GREEN}Saved final bounds to {output_path}{RESET}")
+    messages.append(f"{GREEN}Saved final bounds to {output_path}{RESET}")
     return output_path
 
-def visualize_speech_bubbles(json_path, overwrite=False):
+def visualize_speech_bubbles(json_path, messages, overwrite=False):
     """
     Visualize speech bubbles on the image and save the result.
     
     Args:
         json_path: Path to the JSON file with bounding box data
+        messages: List that log lines for this file are appended to
         overwrite: Whether to overwrite existing files
     
     Returns:
-        Path to the saved visualized image or None if processing failed
+        STATUS_OK, STATUS_SKIPPED or STATUS_ERROR
     """
     # Load the JSON data
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        data = json_loads(f.read())
     
     # Get the image path from the JSON data
     image_path = data['path']
     
+    # Create output filename
+    folder = data['folder']
+    bubble_number = data['bubble_number']
+    output_filename = f"vis_bubbles_spread-{folder}-{bubble_number}.jpg"
+    output_path = os.path.join(OUTPUT_DIR, output_filename)
+    
     # Check if the image exists
     if not os.path.exists(image_path):
-        print(f"{RED}Error: Image {image_path} does not exist{RESET}")
-        return None
-    
-    # Read the image
-    image = cv2.imread(image_path)
-    if image is None:
-        print(f"{RED}Error: Could not read image {image_path}{RESET}")
-        return None
-    
-    # Create a copy of the image for visualization
-    vis_image = image.copy()
+        messages.append(f"{RED}Error: Image {image_path} does not exist{RESET}")
+        return STATUS_ERROR
     
-    # Get all text regions
-    regions = data['text_regions']
+    # Get all text regions, dropping blank or zero-area ones before any clustering work
+    regions = [region for region in data['text_regions']
+               if region['text'].strip() and region['width'] > 0 and region['height'] > 0]
     
     if not regions:
-        print(f"{YELLOW}No text regions found in {json_path}{RESET}")
-        return None
+        messages.append(f"{YELLOW}No text regions found in {json_path}{RESET}")
+        return STATUS_ERROR
+    
+    # Bounding boxes of all text regions, shared by every step below
+    boxes = get_region_boxes(regions)
     
-    # Group text regions into separate bubbles
-    bubble_groups = group_text_regions_by_distance(regions, eps=CLUSTERING_EPS, 
-                                                 vertical_weight=VERTICAL_WEIGHT, 
-                                                 horizontal_penalty=HORIZONTAL_PENALTY)
+    # Group text regions into separate bubbles (cached across runs)
+    bubble_groups = group_text_regions_cached(boxes, json_path, eps=CLUSTERING_EPS, 
+                                              vertical_weight=VERTICAL_WEIGHT, 
+                                              horizontal_penalty=HORIZONTAL_PENALTY)
     
     # Merge overlapping bubbles
-    bubble_groups = merge_overlapping_bubbles(bubble_groups)
+    bubble_groups = merge_overlapping_bubbles(bubble_groups, boxes)
     
     # Filter and prioritize bubbles (keep only the 2 largest)
-    bubble_groups = filter_and_prioritize_bubbles(bubble_groups)
+    bubble_groups = filter_and_prioritize_bubbles(bubble_groups, boxes)
+    
+    # Bounding box, text regions and combined text of each remaining bubble
+    bubble_boxes = [get_bubble_box(boxes, bubble) for bubble in bubble_groups]
+    bubble_groups = [[regions[i] for i in bubble] for bubble in bubble_groups]
+    bubble_texts = [" ".join(region['text'] for region in bubble) for bubble in bubble_groups]
     
     # Save the final processed bounds
-    final_bounds_path = save_final_bounds(data, bubble_groups, json_path, overwrite)
+    final_bounds_path = save_final_bounds(data, bubble_groups, bubble_boxes, bubble_texts, json_path, messages, overwrite)
     
     # If we're not overwriting and the file exists, skip visualization too
     if final_bounds_path is None:
-        return None
+        return STATUS_SKIPPED
+    
+    # Check if visualization file exists and we're not overwriting (before decoding the image)
+    if os.path.exists(output_path) and not overwrite:
+        messages.append(f"{YELLOW}Skipping: Visualization file already exists at {output_path}{RESET}")
+        return STATUS_SKIPPED
+    
+    # Read the image; it is only used for this visualization, so draw on it directly
+    vis_image = cv2.imread(image_path)
+    if vis_image is None:
+        messages.append(f"{RED}Error: Could not read image {image_path}{RESET}")
+        return STATUS_ERROR
     
     # Colors for different bubbles (BGR format)
     colors = [
@@ -295,76 +400,78 @@ def visualize_speech_bubbles(json_path, overwrite=False):
         (255, 0, 0),   # Blue
     ]
     
-    # Draw bounding boxes for each bubble group
-    for i, bubble in enumerate(bubble_groups):
+    # Corners of the rectangle around each bubble, as closed polygons
+    rects = np.array([[[min_x, min_y], [max_x, min_y], [max_x, max_y], [min_x, max_y]]
+                      for min_x, min_y, max_x, max_y in bubble_boxes], dtype=np.int32)
+    
+    # Draw the rectangles with one polylines call per color
+    for c, color in enumerate(colors):
+        color_rects = rects[c::len(colors)]
+        if len(color_rects):
+            cv2.polylines(vis_image, color_rects, True, color, 2)
+    
+    # Add the full text above each rectangle with bubble number
+    for i, ((min_x, min_y, _, _), full_text) in enumerate(zip(bubble_boxes, bubble_texts)):
         color = colors[i % len(colors)]
-        
-        # Find the bounding box that contains all text regions in this bubble
-        min_x = min(region['x'] for region in bubble)
-        min_y = min(region['y'] for region in bubble)
-        max_x = max(region['x'] + region['width'] for region in bubble)
-        max_y = max(region['y'] + region['height'] for region in bubble)
-        
-        # Draw a rectangle around the bubble
-        cv2.rectangle(vis_image, (min_x, min_y), (max_x, max_y), color, 2)
-        
-        # Combine all text in this bubble
-        full_text = " ".join(region['text'] for region in bubble)
-        
-        # Add the full text above the rectangle with bubble number
         label = f"Bubble {i+1}: {full_text}"
         cv2.putText(vis_image, label, (min_x, min_y - 10), 
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
     
-    # Create output filename
-    folder = data['folder']
-    bubble_number = data['bubble_number']
-    output_filename = f"vis_bubbles_spread-{folder}-{bubble_number}.jpg"
-    output_path = os.path.join(OUTPUT_DIR, output_filename)
+    # Save the visualized image
+    cv2.imwrite(output_path, vis_image, JPEG_WRITE_PARAMS)
+    messages.append(f"{GREEN}Saved visualized image to {output_path}{RESET}")
     
-    # Check if visualization file exists and we're not overwriting
-    if os.path.exists(output_path) and not overwrite:
-        print(f"{YELLOW}Skipping: Visualization file already exists at {output_path}{RESET}")
-        return None
+    return STATUS_OK
+
+def _process_file(json_path, overwrite):
+    """
+    Worker entry point: visualize one bounds file and hand its log back to the
+    main process, so each file's output is written in one piece.
     
-    # Save the visualized image
-    cv2.imwrite(output_path, vis_image)
-    print(f"{GREEN}Saved visualized image to {output_path}{RESET}")
+    Args:
+        json_path: Path to the JSON file with bounding box data
+        overwrite: Whether to overwrite existing files
     
-    return output_path
+    Returns:
+        Tuple of (status, log text for the file)
+    """
+    messages = [f"Processing {json_path}..."]
+    status = visualize_speech_bubbles(json_path, messages, overwrite)
+    return status, "\n".join(messages) + "\n"
 
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Visualize speech bubbles and generate final bounds")
     parser.add_argument("-o", "--overwrite", action="store_true", 
                         help="Overwrite existing final bounds files")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
     args = parser.parse_args()
     
     # Ensure output directories exist
     ensure_directory_exists(OUTPUT_DIR)
     ensure_directory_exists(FINAL_BOUNDS_DIR)
+    ensure_directory_exists(CLUSTER_CACHE_DIR)
     
     # Get all JSON files
     json_files = get_json_files(BOUNDS_DIR)
     print(f"Found {len(json_files)} JSON files")
     
-    # Process each JSON file
+    # Process the JSON files in parallel, each one is independent
     success_count = 0
     skip_count = 0
     error_count = 0
     
-    for json_path in json_files:
-        print(f"Processing {json_path}...")
-        result = visualize_speech_bubbles(json_path, args.overwrite)
-        
-        if result:
-            success_count += 1
-        elif result is None and os.path.exists(os.path.join(
-                FINAL_BOUNDS_DIR, 
-                os.path.basename(json_path).replace('_bounds.json', '_final.json'))):
-            skip_count += 1
-        else:
-            error_count += 1
+    worker = partial(_process_file, overwrite=args.overwrite)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for status, log in executor.map(worker, json_files, chunksize=8):
+            sys.stdout.write(log)
+            if status == STATUS_OK:
+                success_count += 1
+            elif status == STATUS_SKIPPED:
+                skip_count += 1
+            else:
+                error_count += 1
     
     # Print summary
     print(f"\nVisualization complete:")